@@ -7,11 +7,11 @@ Run this file to start the goniometer application.
 """
 
 import sys
-from PySide6 import QtWidgets
+from PySide6 import QtGui, QtWidgets
 import pyqtgraph as pg  # type: ignore
 
 from main_window import GoniometerWindow
-from config import APP_INFO
+from config import APP_INFO, GONIOMETER_CONFIG
 
 
 def main() -> None:
@@ -32,16 +32,23 @@ def main() -> None:
         1: Application error or exception
     """
     try:
+        # The OpenGL viewport only antialiases with a multisampled surface;
+        # the default format must be set before the application is created
+        if GONIOMETER_CONFIG["use_opengl"] and GONIOMETER_CONFIG["antialias"]:
+            surface_format = QtGui.QSurfaceFormat.defaultFormat()
+            surface_format.setSamples(4)
+            QtGui.QSurfaceFormat.setDefaultFormat(surface_format)
+        
         # Create Qt application instance
         app = QtWidgets.QApplication(sys.argv)
         app.setApplicationName(APP_INFO["name"])
         app.setApplicationVersion(APP_INFO["version"])
         app.setOrganizationName(APP_INFO["author"])
         
-        # Configure pyqtgraph for better rendering
+        # Configure pyqtgraph for fast redraws
         pg.setConfigOptions(
-            antialias=True,          # Enable antialiasing for smoother plots
-            useOpenGL=False,         # Disable OpenGL for compatibility
+            antialias=GONIOMETER_CONFIG["antialias"],   # Off: redraws at 16 ms
+            useOpenGL=GONIOMETER_CONFIG["use_opengl"],  # Off by default for compatibility
             background='k',          # Default background color
             foreground='w'           # Default foreground color
         )
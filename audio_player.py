@@ -3,10 +3,21 @@ Audio playback and streaming utilities.
 
 This module provides audio playback functionality with real-time streaming
 and signal emission for visualization purposes.
+
+Playback is split between two threads that share a lock-free
+single-producer/single-consumer frame ring. A decoder thread reads ahead of
+the output into preallocated ring slots. The PortAudio callback only copies
+the next decoded slot into the device buffer. Decode hiccups (GC pauses,
+slow disk) are therefore absorbed by the ring instead of causing underruns.
+The GUI pulls the most recently played frame on its own redraw timer, so
+no Qt signal is emitted per audio block.
 """
 
+import ctypes
+import os
+import re
+import sys
 import threading
-import time
 from dataclasses import dataclass
 from typing import Any, Optional, Tuple
 
@@ -18,6 +29,38 @@ from PySide6 import QtCore
 from config import AUDIO_CONFIG, ERROR_MESSAGES
 from youtube_utils import download_youtube_to_wav, YouTubeDownloadError
 
+# http(s) URL on youtube.com (any subdomain) or youtu.be
+_YOUTUBE_URL_RE = re.compile(r'^https?://(?:[\w.-]+\.)?(?:youtube\.com|youtu\.be)/', re.IGNORECASE)
+
+_THREAD_PRIORITY_TIME_CRITICAL = 15  # Windows SetThreadPriority level
+_QOS_CLASS_USER_INTERACTIVE = 0x21   # macOS pthread QoS class
+
+
+def _boost_thread_priority() -> None:
+    """
+    Raise the scheduling priority of the calling thread.
+    
+    Keeps the decoder thread ahead of the Qt GUI and the garbage collector
+    so the frame ring does not run dry under load. Realtime scheduling
+    usually needs privileges; every failure is ignored and the thread simply
+    keeps its default priority.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            try:
+                # pid 0 is the calling thread; scheduling is per-thread on Linux
+                os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(20))
+            except OSError:
+                os.nice(-5)
+        elif sys.platform == 'win32':
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_PRIORITY_TIME_CRITICAL)
+        elif sys.platform == 'darwin':
+            libsystem = ctypes.CDLL('/usr/lib/libSystem.dylib')
+            libsystem.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+    except (OSError, AttributeError):
+        pass  # Unprivileged or unsupported: run at default priority
+
 
 @dataclass
 class AudioSource:
@@ -38,21 +81,143 @@ class AudioPlayerError(Exception):
     """Exception raised when audio playback fails."""
 
 
+class FrameRing:
+    """
+    Single-producer/single-consumer ring of preallocated audio frames.
+    
+    The decoder thread fills the next slot in place and publishes it, and the
+    audio callback consumes published slots in order. Other readers look
+    frames up by sequence number and get a view into the slot, so no array is
+    allocated or copied per block. A sequence number encodes both the slot
+    index and its generation, which lets readers detect slots that have
+    since been overwritten. Each index has a single writer and Python
+    integer stores are atomic, so no lock is needed.
+    
+    Attributes:
+        frames: Backing storage with shape (slots, blocksize, channels)
+    """
+    
+    def __init__(self, slots: int, blocksize: int, channels: int) -> None:
+        """
+        Allocate the ring storage.
+        
+        Args:
+            slots: Number of frame slots (must be a power of two)
+            blocksize: Maximum number of samples per frame
+            channels: Number of audio channels per sample
+        
+        Raises:
+            ValueError: If slots is not a power of two
+        """
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError(f"Ring slot count must be a power of two, got {slots}")
+        
+        self.frames = np.zeros((slots, blocksize, channels), dtype=np.float32)
+        self._lengths = [0] * slots
+        self._steps = [1] * slots
+        self._mask = slots - 1
+        self._write_seq = 0
+        self._read_seq = 0
+    
+    @property
+    def last_consumed(self) -> int:
+        """Sequence number of the most recently consumed frame (-1 if none)."""
+        return self._read_seq - 1
+    
+    def writable(self) -> bool:
+        """
+        Check whether the producer may claim a slot.
+        
+        One slot is always held back so the most recently consumed frame
+        stays intact for readers while the producer runs ahead.
+        
+        Returns:
+            True if a slot can be filled without overwriting pending frames
+        """
+        return self._write_seq - self._read_seq < self._mask
+    
+    def reset(self) -> None:
+        """Drop all pending (published but unconsumed) frames."""
+        self._read_seq = self._write_seq
+    
+    def claim(self) -> np.ndarray:
+        """
+        Get the slot the producer should fill next.
+        
+        Returns:
+            Writable view of the next slot with shape (blocksize, channels)
+        """
+        return self.frames[self._write_seq & self._mask]
+    
+    def publish(self, length: int, step: int = 1) -> int:
+        """
+        Publish the claimed slot to readers.
+        
+        The write sequence is advanced only after the slot contents and
+        length are in place, so readers never observe a partial frame.
+        
+        Args:
+            length: Number of valid samples written into the slot
+            step: Decimation stride readers should see the frame with
+        
+        Returns:
+            Sequence number identifying the published frame
+        """
+        seq = self._write_seq
+        slot = seq & self._mask
+        self._lengths[slot] = length
+        self._steps[slot] = step
+        self._write_seq = seq + 1
+        return seq
+    
+    def consume(self) -> Optional[np.ndarray]:
+        """
+        Take the oldest pending frame (consumer side).
+        
+        The slot stays untouched until the next call, because the producer
+        always keeps one slot in reserve (see writable()).
+        
+        Returns:
+            Full-resolution view of the frame, or None if no frame is pending
+        """
+        seq = self._read_seq
+        if seq >= self._write_seq:
+            return None
+        slot = seq & self._mask
+        self._read_seq = seq + 1
+        return self.frames[slot, :self._lengths[slot]]
+    
+    def frame(self, seq: int) -> Optional[np.ndarray]:
+        """
+        Look up a published frame by sequence number.
+        
+        Args:
+            seq: Sequence number returned by publish()
+        
+        Returns:
+            Decimated view of the frame's valid samples, or None if the slot
+            has already been reused (or is being refilled) for a newer frame
+        """
+        if not 0 <= self._write_seq - 1 - seq < self._mask:
+            return None
+        slot = seq & self._mask
+        return self.frames[slot, :self._lengths[slot]:self._steps[slot]]
+
+
 class AudioPlayer(QtCore.QObject):
     """
-    Audio player with real-time streaming and visualization signal emission.
+    Audio player with real-time streaming and pull-based visualization data.
     
-    This class reads frames from an audio file and feeds them to both a
-    sounddevice OutputStream for playback and emits signals for visualization.
+    This class reads frames from an audio file and feeds them to a
+    sounddevice OutputStream for playback. The visualization polls
+    latest_frame() from a GUI timer instead of receiving a signal per block.
     It supports both local files and YouTube URLs.
     
     Signals:
-        frame_available: Emitted with each audio chunk (np.ndarray) for visualization
         state_changed: Emitted when playback state changes (bool: playing or not)
     """
     
     # Qt signals for communication with GUI
-    frame_available = QtCore.Signal(np.ndarray)  
     state_changed = QtCore.Signal(bool)
 
     def __init__(self, parent: Any = None) -> None:
@@ -67,22 +232,57 @@ class AudioPlayer(QtCore.QObject):
         # Audio file and stream objects
         self._file: Optional[sf.SoundFile] = None
         self._stream: Optional[sd.OutputStream] = None
+        self._ring: Optional[FrameRing] = None
         
         # Threading control
         self._thread: Optional[threading.Thread] = None
         self._running = False
-        self._paused = False
-        self._lock = threading.Lock()
+        self._resume_event = threading.Event()  # Cleared while paused
+        self._resume_event.set()
+        self._space_event = threading.Event()  # Set by the callback as it frees slots
+        
+        # Playback position and file length in samples
+        self._position = 0
+        self._duration_frames = 0
         
         # Audio configuration from config module
         self.blocksize = AUDIO_CONFIG["blocksize"]
+        self.max_display_points = AUDIO_CONFIG["max_gonio_points"]
         self.channels = AUDIO_CONFIG["default_channels"]
         self.samplerate = AUDIO_CONFIG["default_samplerate"]
 
+    def resolve_source(self, path: str,
+                       cancel_event: Optional[threading.Event] = None) -> Tuple[str, str]:
+        """
+        Turn an audio source into a local file path, downloading if needed.
+        
+        This does not touch the player's state, so it can run on a worker
+        thread while the GUI stays responsive; pass the returned path to
+        open() afterwards.
+        
+        Args:
+            path: Path to audio file or YouTube URL
+            cancel_event: Optional event that cancels a download when set
+            
+        Returns:
+            Tuple of (local_file_path, display_title); the title is empty
+            for local files
+            
+        Raises:
+            YouTubeDownloadCancelled: If cancel_event is set during a download
+            YouTubeDownloadError: If YouTube download fails
+        """
+        if self._is_youtube_url(path):
+            return download_youtube_to_wav(path, cancel_event)
+        return path, ""
+
     def open(self, path: str) -> Tuple[str, str]:
         """
         Open an audio source (local file or YouTube URL).
         
+        YouTube URLs are downloaded first, which blocks; GUI code should
+        call resolve_source() off the GUI thread and open the local file.
+        
         Args:
             path: Path to audio file or YouTube URL
             
@@ -98,22 +298,22 @@ class AudioPlayer(QtCore.QObject):
             >>> file_path, title = player.open("https://youtube.com/watch?v=...")
             >>> print(f"Opened: {title}")
         """
-        title = ""
-        actual_path = path
-        
         try:
-            # Handle YouTube URLs
-            if self._is_youtube_url(path):
-                actual_path, title = download_youtube_to_wav(path)
+            actual_path, title = self.resolve_source(path)
             
             # Open the audio file
             audio_file = sf.SoundFile(actual_path, mode='r')
             self._file = audio_file
+            self._position = 0
+            self._duration_frames = len(audio_file)  # Queried once, not per block
             
             # Update audio parameters from file
             self.samplerate = audio_file.samplerate
             self.channels = audio_file.channels
             
+            # Preallocate frame slots shared with the visualization
+            self._ring = FrameRing(AUDIO_CONFIG["ring_slots"], self.blocksize, self.channels)
+            
             return actual_path, title
             
         except (OSError, sf.LibsndfileError) as e:
@@ -132,6 +332,7 @@ class AudioPlayer(QtCore.QObject):
         if self._file is not None:
             self._file.close()
             self._file = None
+            self._duration_frames = 0
 
     def play(self) -> None:
         """
@@ -148,59 +349,102 @@ class AudioPlayer(QtCore.QObject):
             
         # If already running, just unpause
         if self._running:
-            with self._lock:
-                self._paused = False
+            self._resume_event.set()
             self.state_changed.emit(True)
             return
         
-        # Start new playback thread
+        if self._ring is None:
+            return
+        ring = self._ring
+        
+        # Start new playback thread; frames decoded ahead during a previous
+        # run were never heard, so resume decoding from the playback position
+        ring.reset()
+        self._file.seek(self._position)
         self._running = True
-        self._paused = False
-
+        self._resume_event.set()
+        decode_done = threading.Event()
+        
+        def fill_output(outdata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+            """
+            PortAudio callback: copy the next decoded frame to the device.
+            
+            Runs on PortAudio's audio thread, so it only copies between
+            preallocated buffers and never allocates, blocks or emits signals.
+            """
+            if not self._resume_event.is_set():
+                outdata.fill(0)  # Paused: output silence, keep pending frames
+                return
+            
+            block = ring.consume()
+            if block is None:
+                if decode_done.is_set():
+                    raise sd.CallbackStop  # Everything decoded has been played
+                outdata.fill(0)  # Decoder fell behind: output silence
+                return
+            
+            played = min(len(block), frames)
+            outdata[:played] = block[:played]
+            if played < frames:
+                outdata[played:].fill(0)  # Short final block
+            self._position += played
+            self._space_event.set()
+        
         def audio_thread() -> None:
             """
-            Main audio playback thread function.
+            Decoder thread function.
             
-            This function runs in a separate thread and handles the actual
-            audio streaming and signal emission for visualization.
+            Decodes ahead of the output into the frame ring and waits for
+            the callback to free slots.
             """
+            _boost_thread_priority()
             stream = None
+            decoded = self._position  # play() seeked the file here
             try:
-                # Initialize audio stream with file parameters
+                # The stream pulls frames from the ring through fill_output
                 stream = sd.OutputStream(
                     samplerate=self.samplerate,
                     channels=self.channels,
-                    blocksize=self.blocksize
+                    blocksize=self.blocksize,
+                    dtype='float32',
+                    latency=AUDIO_CONFIG["latency"],
+                    callback=fill_output,
+                    finished_callback=self._space_event.set
                 )
                 self._stream = stream
                 stream.start()
                 
                 while self._running:
-                    # Check pause state
-                    with self._lock:
-                        paused = self._paused
+                    if not stream.active:
+                        # Output drained after EOF, or stopped early (device
+                        # lost, callback error): either way playback is over
+                        break
                     
-                    if paused:
-                        time.sleep(0.02)  # Small sleep to prevent busy waiting
-                        continue
-                    
-                    # Check for end of file
-                    if self._file is not None and self._file.tell() >= len(self._file):
-                        break  # Reached EOF
-                    
-                    # Read and play audio data
-                    if self._file is not None:
-                        data = self._file.read(self.blocksize, dtype='float32', always_2d=True)
-                        
-                        if len(data) == 0:
-                            break  # No more data
-                        
-                        # Send to audio output
-                        stream.write(data)
+                    if not decode_done.is_set() and ring.writable():
+                        # Check for end of file
+                        if self._file is None or decoded >= self._duration_frames:
+                            decode_done.set()
+                            continue
                         
-                        # Emit signal for visualization (copy to avoid race conditions)
-                        self.frame_available.emit(data.copy())
+                        # Decode straight into the next preallocated frame slot
+                        slot = ring.claim()
+                        frames = self._file.buffer_read_into(slot, dtype='float32')
+                        if frames < self.blocksize:
+                            decode_done.set()  # Short read: this was the last block
+                        if frames == 0:
+                            continue
+                        decoded += frames
                         
+                        # The display only needs max_display_points samples; both
+                        # channels share the stride so L/R pairs stay aligned
+                        step = max(1, frames // self.max_display_points)
+                        ring.publish(frames, step)
+                        continue
+                    
+                    # Ring full (or drained): sleep until the callback frees a slot
+                    self._space_event.wait()
+                    self._space_event.clear()
+            
             except Exception as e:
                 # Log error but don't crash the application
                 print(f"Audio thread error: {e}")
@@ -230,9 +474,8 @@ class AudioPlayer(QtCore.QObject):
         """
         if not self._running:
             return
-            
-        with self._lock:
-            self._paused = True
+        
+        self._resume_event.clear()
         self.state_changed.emit(False)
 
     def stop(self) -> None:
@@ -242,7 +485,19 @@ class AudioPlayer(QtCore.QObject):
         This stops the playback thread and releases audio resources.
         To resume, play() must be called again.
         """
+        # The resume flag is left as it is: setting it here would let the
+        # callback of a paused stream output one more block before the abort.
+        # play() sets it again
         self._running = False
+        self._space_event.set()  # Wake the decoder thread if it is waiting
+        
+        # Abort rather than drain so the output stops immediately
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.abort()
+            except Exception:
+                pass  # Stream may already be closing on the audio thread
         
         # Wait for thread to finish
         if self._thread is not None and self._thread.is_alive():
@@ -252,7 +507,6 @@ class AudioPlayer(QtCore.QObject):
         # Clean up stream
         if self._stream is not None:
             try:
-                self._stream.stop()
                 self._stream.close()
             except Exception:
                 pass  # Best effort cleanup
@@ -273,6 +527,7 @@ class AudioPlayer(QtCore.QObject):
         
         # Reset file position to beginning
         self._file.seek(0)
+        self._position = 0
         
         if was_playing:
             # Restart playback after a small delay for clean restart
@@ -296,18 +551,21 @@ class AudioPlayer(QtCore.QObject):
         Returns:
             True if audio is paused, False if playing or stopped
         """
-        return self._paused
+        return self._running and not self._resume_event.is_set()
     
     @property
     def position(self) -> int:
         """
         Get the current playback position in samples.
         
+        The decoder reads ahead of the output, so this tracks the samples
+        handed to the audio device rather than the file's read position.
+        
         Returns:
             Current position in the audio file (samples from start)
         """
         if self._file is not None:
-            return int(self._file.tell())
+            return self._position
         return 0
     
     @property
@@ -318,9 +576,39 @@ class AudioPlayer(QtCore.QObject):
         Returns:
             Total length of the audio file in samples
         """
-        if self._file is not None:
-            return len(self._file)
-        return 0
+        return self._duration_frames
+    
+    @property
+    def frame_sequence(self) -> int:
+        """
+        Get the sequence number of the chunk returned by latest_frame().
+        
+        The number changes whenever a new chunk reaches the output device,
+        so pollers can skip work while playback is paused or starved.
+        
+        Returns:
+            Sequence number of the latest played chunk, or -1 if none
+        """
+        if self._ring is None:
+            return -1
+        return self._ring.last_consumed
+    
+    def latest_frame(self) -> Optional[np.ndarray]:
+        """
+        Get the audio chunk most recently handed to the output device.
+        
+        Meant to be polled from the GUI's redraw timer. The chunk arrives
+        already decimated for display (see max_display_points). The returned
+        array is a view into the player's frame ring and is reused once the
+        ring wraps around; copy it if it must be kept.
+        
+        Returns:
+            Audio data with shape (samples, channels), or None if nothing
+            has been played yet
+        """
+        if self._ring is None or self._ring.last_consumed < 0:
+            return None
+        return self._ring.frame(self._ring.last_consumed)
     
     def _is_youtube_url(self, url: str) -> bool:
         """
@@ -332,4 +620,4 @@ class AudioPlayer(QtCore.QObject):
         Returns:
             True if URL looks like a YouTube URL, False otherwise
         """
-        return url.lower().startswith('http') and 'youtube' in url.lower()
\ No newline at end of file
+        return _YOUTUBE_URL_RE.match(url) is not None
\ No newline at end of file
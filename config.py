@@ -6,6 +6,7 @@ used throughout the application for easy customization and maintenance.
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 
 # Audio Configuration
@@ -13,6 +14,8 @@ AUDIO_CONFIG: Dict[str, Any] = {
     "default_samplerate": 44100,
     "default_channels": 2,
     "blocksize": 1024,
+    "ring_slots": 16,  # Preallocated frame slots between decoder and output (power of two)
+    "latency": "high",  # PortAudio output latency; 'high' favours glitch-free playback
     "max_gonio_points": 800,
     "audio_smoothing_alpha": 0.8,
 }
@@ -25,6 +28,7 @@ YOUTUBE_CONFIG: Dict[str, str] = {
     "audio_quality": "0",  # Best quality
     "resample_rate": "44100",
     "channels": "2",  # Stereo
+    "concurrent_fragments": "8",  # Parallel fragment fetches for DASH/HLS streams
 }
 
 # FFmpeg Configuration
@@ -49,10 +53,26 @@ def get_ffmpeg_path() -> str:
     else:  # Linux and others
         return "/usr/bin"
 
-FFMPEG_CONFIG: Dict[str, Any] = {
-    "default_path": get_ffmpeg_path(),
+class _LazyFFmpegConfig(Dict[str, Any]):
+    """
+    FFmpeg settings whose "default_path" is resolved on first access.
+    
+    Locating FFmpeg scans PATH, which is not needed by modules that only
+    import config for colors or constants, so the lookup is deferred until
+    FFMPEG_CONFIG["default_path"] is actually read, then cached.
+    """
+    
+    def __missing__(self, key: str) -> Any:
+        """Resolve and cache the FFmpeg path the first time it is requested."""
+        if key != "default_path":
+            raise KeyError(key)
+        value = get_ffmpeg_path()
+        self[key] = value
+        return value
+
+FFMPEG_CONFIG: Dict[str, Any] = _LazyFFmpegConfig({
     "timeout": 30.0,  # Download timeout in seconds
-}
+})
 
 # UI Colors and Styling
 COLORS: Dict[str, Any] = {
@@ -93,6 +113,17 @@ COLORS: Dict[str, Any] = {
     "text_secondary": (200, 200, 200),
 }
 
+def _css(color: Tuple[int, ...]) -> str:
+    """Format an RGB or RGBA tuple as a CSS rgba() color (opaque when alpha is missing)."""
+    alpha = color[3] if len(color) > 3 else 255
+    return f"rgba({color[0]}, {color[1]}, {color[2]}, {alpha})"
+
+# CSS strings for the tuple colors above, preformatted for stylesheets;
+# pyqtgraph pens and brushes keep using the numeric tuples in COLORS
+COLORS_CSS: Dict[str, str] = {
+    name: _css(color) for name, color in COLORS.items() if isinstance(color, tuple)
+}
+
 # UI Layout Configuration
 UI_CONFIG: Dict[str, Any] = {
     "window_size": (800, 800),  # Square window for equal L&R channel display
@@ -119,6 +150,8 @@ GONIOMETER_CONFIG: Dict[str, Any] = {
     "show_grid": True,
     "grid_alpha": 0.3,
     "scatter_size": 3,
+    "antialias": False,  # AA is invisible on 3 px dots but costly on the CPU raster path
+    "use_opengl": False,  # Opt-in; needs PyOpenGL and a working GL driver
     "max_points": 800,
     "trail_max_frames": 5,
     "center_line_style": "dash",
@@ -147,7 +180,7 @@ SHORTCUTS: Dict[str, str] = {
 
 # Timer Configuration
 TIMER_CONFIG: Dict[str, int] = {
-    "redraw_interval": 30,  # milliseconds
+    "redraw_interval": 16,  # milliseconds (~60 Hz display refresh)
     "status_message_timeout": 1500,  # milliseconds
     "restart_delay": 50,  # milliseconds
 }
@@ -171,24 +204,23 @@ APP_INFO: Dict[str, str] = {
     "copyright": "© 2024 Enda111",
 }
 
+@lru_cache(maxsize=1)
 def get_stylesheet() -> str:
-    """Generate the main application stylesheet from configuration."""
-    bg_start = COLORS["bg_gradient_start"]
-    bg_end = COLORS["bg_gradient_end"]
-    toolbar_bg = COLORS["toolbar_bg"]
-    button_bg = COLORS["button_bg"]
-    button_hover = COLORS["button_hover"]
-    button_border = COLORS["button_border"]
-    status_bg = COLORS["status_bg"]
+    """
+    Generate the main application stylesheet from configuration.
     
-    # Ensure color tuples are properly formatted for CSS
-    bg_start_rgba = f"rgba({bg_start[0]}, {bg_start[1]}, {bg_start[2]}, 255)"
-    bg_end_rgba = f"rgba({bg_end[0]}, {bg_end[1]}, {bg_end[2]}, 255)"
-    toolbar_rgba = f"rgba({toolbar_bg[0]}, {toolbar_bg[1]}, {toolbar_bg[2]}, {toolbar_bg[3]})"
-    button_rgba = f"rgba({button_bg[0]}, {button_bg[1]}, {button_bg[2]}, {button_bg[3]})"
-    button_hover_rgba = f"rgba({button_hover[0]}, {button_hover[1]}, {button_hover[2]}, {button_hover[3]})"
-    button_border_rgba = f"rgba({button_border[0]}, {button_border[1]}, {button_border[2]}, {button_border[3]})"
-    status_rgba = f"rgba({status_bg[0]}, {status_bg[1]}, {status_bg[2]}, {status_bg[3]})"
+    The result only depends on the constants above, so it is built once and
+    cached; call get_stylesheet.cache_clear() after changing COLORS_CSS or
+    UI_CONFIG at runtime.
+    """
+    # CSS color strings are preformatted in COLORS_CSS
+    bg_start_rgba = COLORS_CSS["bg_gradient_start"]
+    bg_end_rgba = COLORS_CSS["bg_gradient_end"]
+    toolbar_rgba = COLORS_CSS["toolbar_bg"]
+    button_rgba = COLORS_CSS["button_bg"]
+    button_hover_rgba = COLORS_CSS["button_hover"]
+    button_border_rgba = COLORS_CSS["button_border"]
+    status_rgba = COLORS_CSS["status_bg"]
     
     # Get UI configuration values
     title_font_size = str(UI_CONFIG["font_sizes"]["title"])
@@ -236,4 +268,7 @@ def get_stylesheet() -> str:
             border-top: 1px solid rgba(80, 85, 100, 100);
             font-size: {status_font_size}px;
         }}
-    """
\ No newline at end of file
+    """
+
+# Prebuilt application stylesheet; use get_stylesheet() after runtime edits
+STYLESHEET: str = get_stylesheet()
\ No newline at end of file
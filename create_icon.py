@@ -5,47 +5,198 @@ This script generates custom icons for the application, including Windows ICO fo
 and various PNG sizes for different use cases.
 """
 
-from typing import List, Tuple
-from PIL import Image, ImageDraw
+import argparse
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from PIL import Image
 import numpy as np
 
-def create_goniometer_icon() -> Image.Image:
-    """Create a ultra-high-resolution 2048x2048 woven G icon with authentic braided gaps."""
+# Icon geometry is laid out on this grid and scaled to the requested size
+DESIGN_SIZE = 2048
+
+# Sizes below this are drawn without the woven texture and accent dots
+DETAIL_MIN_SIZE = 128
+
+# Enhanced goniometer colors for braided effect (RGBA)
+_PALETTE = np.array([
+    (0, 255, 0, 220),      # Bright green
+    (20, 235, 20, 200),    # Slightly dimmer
+    (40, 215, 40, 180),    # Medium
+    (0, 200, 50, 160),     # Darker green
+    (0, 180, 80, 140),     # Even darker
+], dtype=np.uint8)
+
+# Fixed colors of the icon's solid elements (RGBA)
+_BACKGROUND_COLOR = (15, 18, 25, 255)
+_OUTLINE_COLOR = (40, 50, 65, 255)
+_G_STROKE_COLOR = (0, 255, 0, 200)
+_CORNER_DOT_COLOR = np.array([0, 255, 0, 150], dtype=np.uint8)
+_CROSSHAIR_COLOR = (60, 80, 60, 100)
+_ACCENT_DOT_COLOR = np.array([0, 255, 0, 0], dtype=np.uint8)  # Alpha is randomized per dot
+
+def _paint_stamps(canvas: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                  dx: np.ndarray, dy: np.ndarray, inside: np.ndarray,
+                  colors: np.ndarray) -> None:
+    """
+    Write the pixels covered by a batch of stamps into an RGBA pixel array.
     
-    # Create a ultra-high-resolution 2048x2048 image with transparent background
-    size = 2048
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    Args:
+        canvas: (height, width, 4) uint8 array to draw into
+        xs, ys: Stamp origins in pixels
+        dx, dy: Pixel offsets of the shared stamp grid
+        inside: (n, *dx.shape) mask of the grid pixels each stamp covers
+        colors: (n, 4) RGBA colors, one per stamp
+    """
+    stamp, row, col = np.nonzero(inside)
+    px = xs[stamp] + dx[row, col]
+    py = ys[stamp] + dy[row, col]
+    height, width = canvas.shape[:2]
+    visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    canvas[py[visible], px[visible]] = colors[stamp[visible]]
+
+def stamp_disks(canvas: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                radii: np.ndarray, colors: np.ndarray) -> None:
+    """
+    Draw filled disks straight into an RGBA pixel array.
     
-    # Dark background circle with subtle gradient
-    margin = 40
-    circle_bbox = [margin, margin, size - margin, size - margin]
-    draw.ellipse(circle_bbox, fill=(15, 18, 25, 255), outline=(40, 50, 65, 255), width=6)
+    Pixels are overwritten rather than blended, matching what ImageDraw does
+    on an RGBA image, so this is a drop-in replacement for a run of
+    draw.ellipse() calls without a Python-to-PIL call per dot.
+    
+    Args:
+        canvas: (height, width, 4) uint8 array to draw into
+        xs, ys: Disk centers in pixels
+        radii: Disk radii in pixels
+        colors: (n, 4) RGBA colors, one per disk
+    """
+    if len(xs) == 0:
+        return
+    r = int(radii.max())
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    inside = dx * dx + dy * dy <= (radii * radii)[:, None, None]
+    _paint_stamps(canvas, xs, ys, dx, dy, inside, colors)
+
+def stamp_rects(canvas: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                widths: np.ndarray, heights: np.ndarray, colors: np.ndarray) -> None:
+    """
+    Draw filled axis-aligned rectangles straight into an RGBA pixel array.
+    
+    Used for thick horizontal and vertical strokes in place of draw.line();
+    pixels are overwritten like stamp_disks().
+    
+    Args:
+        canvas: (height, width, 4) uint8 array to draw into
+        xs, ys: Top-left corners in pixels
+        widths, heights: Rectangle sizes in pixels
+        colors: (n, 4) RGBA colors, one per rectangle
+    """
+    if len(xs) == 0:
+        return
+    dy, dx = np.mgrid[0:int(heights.max()), 0:int(widths.max())]
+    inside = (dx < widths[:, None, None]) & (dy < heights[:, None, None])
+    _paint_stamps(canvas, xs, ys, dx, dy, inside, colors)
+
+def fill_disk(canvas: np.ndarray, cx: float, cy: float, radius: float,
+              color: Tuple[int, int, int, int]) -> None:
+    """
+    Fill one large disk in an RGBA pixel array.
+    
+    Every row of a disk is a single run of pixels, so the disk is written as
+    one slice assignment per row on a uint32 view of the canvas. That is
+    much cheaper than building and applying a full-size distance mask, and
+    cheaper than draw.ellipse() plus converting the image to an array.
+    
+    Args:
+        canvas: (height, width, 4) uint8 array to draw into
+        cx, cy: Disk center in pixel coordinates
+        radius: Disk radius in pixels
+        color: RGBA fill color
+    """
+    pixels = canvas.view(np.uint32)[:, :, 0]
+    value = np.array(color, dtype=np.uint8).view(np.uint32)[0]
+    height, width = pixels.shape
+    dy = np.arange(height) - cy
+    reach = radius * radius - dy * dy
+    half = np.sqrt(np.maximum(reach, 0))
+    starts = np.clip(np.ceil(cx - half).astype(int), 0, width)
+    stops = np.clip(np.floor(cx + half).astype(int) + 1, 0, width)
+    for row in np.nonzero(reach >= 0)[0]:
+        pixels[row, starts[row]:stops[row]] = value
+
+def _texture_colors(rng: np.random.Generator, count: int, alpha_low: int, alpha_high: int) -> np.ndarray:
+    """Pick random palette colors with random alpha for a batch of strokes."""
+    colors = _PALETTE[rng.integers(0, len(_PALETTE), count)]  # Fancy indexing copies
+    colors[:, 3] = rng.integers(alpha_low, alpha_high, count)
+    return colors
+
+def create_goniometer_icon(size: int = DESIGN_SIZE, seed: Optional[int] = None) -> Image.Image:
+    """
+    Create a woven G icon with authentic braided gaps, rendered natively at any size.
+    
+    The layout is defined on a 2048x2048 design grid and mapped to the
+    requested size while drawing, so each size is rasterized directly rather
+    than downsampled from a huge render. Below DETAIL_MIN_SIZE the woven
+    texture, crosshair and accent dots would only turn into noise, so small icons get a
+    clean solid G instead. With the same seed every size shows the same
+    texture pattern.
+    
+    Args:
+        size: Output width and height in pixels
+        seed: Seed for the texture randomness, or None for a fresh pattern
+    
+    Returns:
+        The rendered RGBA icon image
+    """
+    
+    # One generator for every random draw instead of the legacy global state
+    rng = np.random.default_rng(seed)
+    
+    # Map design-grid units to output pixels
+    scale = size / DESIGN_SIZE
+    detailed = size >= DETAIL_MIN_SIZE
     
-    # Enhanced goniometer colors for braided effect
-    gonio_colors = [
-        (0, 255, 0, 220),      # Bright green
-        (20, 235, 20, 200),    # Slightly dimmer
-        (40, 215, 40, 180),    # Medium
-        (0, 200, 50, 160),     # Darker green
-        (0, 180, 80, 140),     # Even darker
-    ]
+    def px(value: float) -> int:
+        """Convert a design-grid length or coordinate to pixels."""
+        return int(round(value * scale))
     
-    center_x, center_y = size // 2, size // 2
+    def to_px(values: np.ndarray) -> np.ndarray:
+        """Convert design-grid coordinates to pixel coordinates."""
+        return np.round(values * scale).astype(int)
+    
+    def to_extent(values: np.ndarray) -> np.ndarray:
+        """Convert design-grid sizes to pixels, keeping every stroke at least 1 px."""
+        return np.maximum(1, to_px(values))
+    
+    # Create the image with transparent background; everything is written
+    # straight into the pixel array, overwriting pixels like ImageDraw does,
+    # and wrapped as an image once at the end
+    canvas = np.zeros((size, size, 4), dtype=np.uint8)
+    
+    # Dark background circle with an outline ring
+    design = DESIGN_SIZE
+    margin = 40
+    circle_center = (px(margin) + px(design - margin)) / 2
+    circle_radius = (px(design - margin) - px(margin)) / 2 + 0.5
+    fill_disk(canvas, circle_center, circle_center, circle_radius, _OUTLINE_COLOR)
+    fill_disk(canvas, circle_center, circle_center, circle_radius - max(1, px(6)), _BACKGROUND_COLOR)
+    
+    center_x, center_y = design // 2, design // 2
     
     # Create a circular G - scaled up for ultra-high resolution
-    g_radius = 640  # Much larger for 2048x2048 resolution
+    g_radius = 640  # Much larger for the 2048x2048 design grid
     
-    def fill_with_woven_texture(region_points: List[Tuple[int, int]], strand_direction: str = "mixed") -> None:
-        """Fill a region with authentic woven texture that has gaps between strands."""
-        if not region_points:
-            return
-            
-        # Find bounding box
-        min_x = min(p[0] for p in region_points)
-        max_x = max(p[0] for p in region_points)
-        min_y = min(p[1] for p in region_points)
-        max_y = max(p[1] for p in region_points)
+    def fill_with_woven_texture(rng: np.random.Generator, canvas: np.ndarray,
+                                bbox: Tuple[int, int, int, int], strand_direction: str = "mixed") -> None:
+        """
+        Fill a (min_x, min_y, max_x, max_y) box with woven texture that has gaps between strands.
+        
+        Every sample point of the weave is evaluated at once as a NumPy grid,
+        and the resulting dots and short strokes are stamped into the canvas
+        pixel array in bulk.
+        """
+        min_x, min_y, max_x, max_y = bbox
         
         # Create woven strands with gaps - scaled for 2048x2048
         strand_width = 12  # Width of individual strands
@@ -54,82 +205,66 @@ def create_goniometer_icon() -> Image.Image:
         
         # Draw horizontal strands
         if strand_direction in ["horizontal", "mixed"]:
-            y = min_y
-            while y < max_y:
-                # Create slightly wavy horizontal strands
-                for x in range(min_x, max_x, 4):  # High resolution sampling
-                    wave_offset = int(6 * np.sin(x * 0.02 + y * 0.01))  # Weaving pattern
-                    strand_y = y + wave_offset
-                    
-                    # Only draw if within strand area (not in gap)
-                    strand_phase = (strand_y % total_width)
-                    if strand_phase < strand_width:
-                        # Add texture elements to the strand
-                        if np.random.random() < 0.4:  # Less dense for more realistic weave
-                            if np.random.random() < 0.6:  # Dots
-                                dot_size = np.random.randint(2, 8)
-                                alpha = np.random.randint(140, 255)
-                                color_idx = int(np.random.randint(0, len(gonio_colors)))
-                                base_color = gonio_colors[color_idx]
-                                color = (base_color[0], base_color[1], base_color[2], alpha)
-                                draw.ellipse([x - dot_size, strand_y - dot_size, 
-                                            x + dot_size, strand_y + dot_size], fill=color)
-                            else:  # Short horizontal lines
-                                length = np.random.randint(8, 20)
-                                thickness = np.random.randint(2, 6)
-                                alpha = np.random.randint(120, 200)
-                                color_idx = int(np.random.randint(0, len(gonio_colors)))
-                                base_color = gonio_colors[color_idx]
-                                color = (base_color[0], base_color[1], base_color[2], alpha)
-                                draw.line([x, strand_y, x + length, strand_y], 
-                                        fill=color, width=thickness)
-                y += 6  # Move to next row
+            # Rows every 6 px, sampled every 4 px for high resolution
+            y, x = np.meshgrid(np.arange(min_y, max_y, 6), np.arange(min_x, max_x, 4), indexing='ij')
+            
+            # Create slightly wavy horizontal strands
+            strand_y = y + (6 * np.sin(x * 0.02 + y * 0.01)).astype(int)  # Weaving pattern
+            
+            # Only draw within strand area (not in gap), less dense for more realistic weave
+            textured = (strand_y % total_width < strand_width) & (rng.random(y.shape) < 0.4)
+            x, strand_y = x[textured], strand_y[textured]
+            is_dot = rng.random(len(x)) < 0.6
+            
+            # Dots
+            dots = np.count_nonzero(is_dot)
+            stamp_disks(canvas, to_px(x[is_dot]), to_px(strand_y[is_dot]), to_extent(rng.integers(2, 8, dots)),
+                        _texture_colors(rng, dots, 140, 255))
+            
+            # Short horizontal lines
+            lines = len(x) - dots
+            length = rng.integers(8, 20, lines)
+            thickness = rng.integers(2, 6, lines)
+            stamp_rects(canvas, to_px(x[~is_dot]), to_px(strand_y[~is_dot] - thickness // 2),
+                        to_extent(length + 1), to_extent(thickness),
+                        _texture_colors(rng, lines, 120, 200))
         
         # Draw vertical strands (interweaving)
         if strand_direction in ["vertical", "mixed"]:
-            x = min_x
-            while x < max_x:
-                # Create slightly wavy vertical strands
-                for y in range(min_y, max_y, 4):  # High resolution sampling
-                    wave_offset = int(8 * np.sin(y * 0.018 + x * 0.012))  # Different weave pattern
-                    strand_x = x + wave_offset
-                    
-                    # Only draw if within strand area and interweaving properly
-                    strand_phase = (strand_x % total_width)
-                    weave_phase = (y // (total_width // 2)) % 2  # Over/under pattern
-                    
-                    if strand_phase < strand_width:
-                        # Interweaving logic - some areas hidden behind horizontal strands
-                        horizontal_strand_phase = (y % total_width)
-                        if horizontal_strand_phase >= strand_width or weave_phase == 1:
-                            # Add texture elements to visible vertical strand
-                            if np.random.random() < 0.35:  # Slightly less dense
-                                if np.random.random() < 0.5:  # Dots
-                                    dot_size = np.random.randint(2, 7)
-                                    alpha = np.random.randint(130, 240)
-                                    color_idx = int(np.random.randint(0, len(gonio_colors)))
-                                    base_color = gonio_colors[color_idx]
-                                    color = (base_color[0], base_color[1], base_color[2], alpha)
-                                    draw.ellipse([strand_x - dot_size, y - dot_size, 
-                                                strand_x + dot_size, y + dot_size], fill=color)
-                                else:  # Short vertical lines
-                                    length = np.random.randint(6, 16)
-                                    thickness = np.random.randint(2, 5)
-                                    alpha = np.random.randint(110, 190)
-                                    color_idx = int(np.random.randint(0, len(gonio_colors)))
-                                    base_color = gonio_colors[color_idx]
-                                    color = (base_color[0], base_color[1], base_color[2], alpha)
-                                    draw.line([strand_x, y, strand_x, y + length], 
-                                            fill=color, width=thickness)
-                x += 7  # Move to next column
-    
-    def create_bold_g() -> None:
+            # Columns every 7 px, sampled every 4 px for high resolution
+            x, y = np.meshgrid(np.arange(min_x, max_x, 7), np.arange(min_y, max_y, 4), indexing='ij')
+            
+            # Create slightly wavy vertical strands
+            strand_x = x + (8 * np.sin(y * 0.018 + x * 0.012)).astype(int)  # Different weave pattern
+            
+            # Only draw within strand area and where the strand passes over the
+            # horizontal strands (over/under pattern); slightly less dense
+            weave_phase = (y // (total_width // 2)) % 2
+            visible = (y % total_width >= strand_width) | (weave_phase == 1)
+            textured = (strand_x % total_width < strand_width) & visible & (rng.random(x.shape) < 0.35)
+            strand_x, y = strand_x[textured], y[textured]
+            is_dot = rng.random(len(y)) < 0.5
+            
+            # Dots
+            dots = np.count_nonzero(is_dot)
+            stamp_disks(canvas, to_px(strand_x[is_dot]), to_px(y[is_dot]), to_extent(rng.integers(2, 7, dots)),
+                        _texture_colors(rng, dots, 130, 240))
+            
+            # Short vertical lines
+            lines = len(y) - dots
+            length = rng.integers(6, 16, lines)
+            thickness = rng.integers(2, 5, lines)
+            stamp_rects(canvas, to_px(strand_x[~is_dot] - thickness // 2), to_px(y[~is_dot]),
+                        to_extent(thickness), to_extent(length + 1),
+                        _texture_colors(rng, lines, 110, 190))
+    
+    def create_bold_g(rng: np.random.Generator) -> None:
         """Create a bold, clear G shape filled with goniometer texture."""
         
-        # Simple, bold G dimensions - scaled for 2048x2048
+        # Simple, bold G dimensions on the 2048x2048 design grid
         stroke_width = 180  # Much thicker strokes for ultra-high resolution
         
-        # G parameters - centered and large, scaled 4x for 2048x2048
+        # G parameters - centered and large
         g_left = center_x - 400
         g_right = center_x + 320
         g_top = center_y - 440
@@ -138,128 +273,203 @@ def create_goniometer_icon() -> Image.Image:
         g_mid_bar_right = center_x + 120
         
         # 1. Draw the main C-shape outline first (thick green border)
+        def fill_rect(box: List[int]) -> None:
+            """Draw one solid G stroke given in design-grid coordinates (inclusive, like draw.rectangle)."""
+            x0, y0, x1, y1 = (px(v) for v in box)
+            canvas[y0:y1 + 1, x0:x1 + 1] = _G_STROKE_COLOR
         
         # Top horizontal line
-        draw.rectangle([g_left, g_top, g_right - 30, g_top + stroke_width], 
-                      fill=(0, 255, 0, 200))
+        fill_rect([g_left, g_top, g_right - 30, g_top + stroke_width])
         
         # Left vertical line
-        draw.rectangle([g_left, g_top, g_left + stroke_width, g_bottom], 
-                      fill=(0, 255, 0, 200))
+        fill_rect([g_left, g_top, g_left + stroke_width, g_bottom])
         
         # Bottom horizontal line  
-        draw.rectangle([g_left, g_bottom - stroke_width, g_right - 30, g_bottom], 
-                      fill=(0, 255, 0, 200))
+        fill_rect([g_left, g_bottom - stroke_width, g_right - 30, g_bottom])
         
         # Middle horizontal bar (G's distinguishing feature)
-        draw.rectangle([g_mid_bar_right - 20, g_mid_bar_y - stroke_width//2, 
-                       g_right - 15, g_mid_bar_y + stroke_width//2], 
-                      fill=(0, 255, 0, 200))
+        fill_rect([g_mid_bar_right - 20, g_mid_bar_y - stroke_width//2,
+                   g_right - 15, g_mid_bar_y + stroke_width//2])
         
         # Right vertical line (from middle bar down)
-        draw.rectangle([g_right - 45, g_mid_bar_y - stroke_width//2, 
-                       g_right - 15, g_bottom - stroke_width], 
-                      fill=(0, 255, 0, 200))
+        fill_rect([g_right - 45, g_mid_bar_y - stroke_width//2,
+                   g_right - 15, g_bottom - stroke_width])
+        
+        if not detailed:
+            return  # Small icons keep a clean solid G
         
         # 2. Fill the strokes with goniometer texture
         
         # Top stroke region - horizontal weave
-        top_region = [(g_left, g_top), (g_right - 30, g_top), 
-                     (g_right - 30, g_top + stroke_width), (g_left, g_top + stroke_width)]
-        fill_with_woven_texture(top_region, "horizontal")
+        top_bbox = (g_left, g_top, g_right - 30, g_top + stroke_width)
+        fill_with_woven_texture(rng, canvas, top_bbox, "horizontal")
         
         # Left stroke region - vertical weave  
-        left_region = [(g_left, g_top), (g_left + stroke_width, g_top),
-                      (g_left + stroke_width, g_bottom), (g_left, g_bottom)]
-        fill_with_woven_texture(left_region, "vertical")
+        left_bbox = (g_left, g_top, g_left + stroke_width, g_bottom)
+        fill_with_woven_texture(rng, canvas, left_bbox, "vertical")
         
         # Bottom stroke region - horizontal weave
-        bottom_region = [(g_left, g_bottom - stroke_width), (g_right - 30, g_bottom - stroke_width),
-                        (g_right - 30, g_bottom), (g_left, g_bottom)]
-        fill_with_woven_texture(bottom_region, "horizontal")
+        bottom_bbox = (g_left, g_bottom - stroke_width, g_right - 30, g_bottom)
+        fill_with_woven_texture(rng, canvas, bottom_bbox, "horizontal")
         
         # Middle bar region - horizontal weave
-        mid_region = [(g_mid_bar_right - 20, g_mid_bar_y - stroke_width//2),
-                     (g_right - 15, g_mid_bar_y - stroke_width//2),
-                     (g_right - 15, g_mid_bar_y + stroke_width//2),
-                     (g_mid_bar_right - 20, g_mid_bar_y + stroke_width//2)]
-        fill_with_woven_texture(mid_region, "horizontal")
+        mid_bbox = (g_mid_bar_right - 20, g_mid_bar_y - stroke_width//2,
+                    g_right - 15, g_mid_bar_y + stroke_width//2)
+        fill_with_woven_texture(rng, canvas, mid_bbox, "horizontal")
         
         # Right vertical region - vertical weave
-        right_region = [(g_right - 45, g_mid_bar_y - stroke_width//2),
-                       (g_right - 15, g_mid_bar_y - stroke_width//2),
-                       (g_right - 15, g_bottom - stroke_width),
-                       (g_right - 45, g_bottom - stroke_width)]
-        fill_with_woven_texture(right_region, "vertical")
+        right_bbox = (g_right - 45, g_mid_bar_y - stroke_width//2,
+                      g_right - 15, g_bottom - stroke_width)
+        fill_with_woven_texture(rng, canvas, right_bbox, "vertical")
         
-        # 3. Add some curved corners for a more polished look - scaled for 2048x2048
+        # 3. Add some curved corners for a more polished look
         corner_radius = 60
         
-        # Round the outer corners slightly
-        for corner_x, corner_y in [(g_left, g_top), (g_left, g_bottom), 
-                                  (g_right - 30, g_top)]:
-            for angle in np.linspace(0, np.pi/2, 10):
-                x = int(corner_x + corner_radius * np.cos(angle))
-                y = int(corner_y + corner_radius * np.sin(angle))
-                dot_size = 3
-                draw.ellipse([x - dot_size, y - dot_size, x + dot_size, y + dot_size], 
-                           fill=(0, 255, 0, 150))
+        # Round the outer corners slightly: 10 dots on a quarter arc per corner
+        corners = np.array([(g_left, g_top), (g_left, g_bottom), (g_right - 30, g_top)])
+        angles = np.linspace(0, np.pi/2, 10)
+        xs = (corners[:, :1] + corner_radius * np.cos(angles)).astype(int).ravel()
+        ys = (corners[:, 1:] + corner_radius * np.sin(angles)).astype(int).ravel()
+        dot_size = 3
+        stamp_disks(canvas, to_px(xs), to_px(ys), to_extent(np.full(len(xs), dot_size)),
+                    np.tile(_CORNER_DOT_COLOR, (len(xs), 1)))
     
     # Create the bold, clear G
-    create_bold_g()
-    
-    # Add subtle crosshairs in background (like goniometer display)
-    crosshair_color = (60, 80, 60, 100)
-    draw.line([center_x, margin + 15, center_x, size - margin - 15], fill=crosshair_color, width=1)
-    draw.line([margin + 15, center_y, size - margin - 15, center_y], fill=crosshair_color, width=1)
-    
-    # Add some final decorative accent dots around the entire design - scaled for 2048x2048
-    for _ in range(120):  # More dots for higher resolution
-        # Random dots in the overall icon area
-        x = np.random.randint(200, size - 200)
-        y = np.random.randint(200, size - 200)
+    create_bold_g(rng)
+    
+    if not detailed:
+        return Image.fromarray(canvas, 'RGBA')
+    
+    # Add subtle crosshairs in background (like goniometer display); on small
+    # renders the 1 px lines would replace a large share of the disc and G
+    # with their translucent color instead of fading into the background
+    line_start, line_end = px(margin + 15), px(design - margin - 15)
+    canvas[line_start:line_end + 1, px(center_x)] = _CROSSHAIR_COLOR
+    canvas[px(center_y), line_start:line_end + 1] = _CROSSHAIR_COLOR
+    
+    # Add some final decorative accent dots around the entire design
+    dot_count = 120  # More dots for higher resolution
+    xs = rng.integers(200, design - 200, dot_count)
+    ys = rng.integers(200, design - 200, dot_count)
+    
+    # Only add dots outside the main G area to avoid clutter
+    outside = np.hypot(xs - center_x, ys - center_y) > g_radius + 120
+    xs, ys = xs[outside], ys[outside]
+    dot_sizes = rng.integers(4, 12, len(xs))  # Larger dots for the high-resolution design
+    colors = np.tile(_ACCENT_DOT_COLOR, (len(xs), 1))
+    colors[:, 3] = rng.integers(40, 100, len(xs))
+    
+    stamp_disks(canvas, to_px(xs), to_px(ys), to_extent(dot_sizes), colors)
+    return Image.fromarray(canvas, 'RGBA')
+
+def resize_icon(master: Image.Image, size: int) -> Image.Image:
+    """
+    Downsample a master icon to a square size.
+    
+    Exact halvings (every mipmap level) use Image.reduce(), a 2x2 box filter
+    with no per-call filter weights. Other reductions of at most 2x use
+    BILINEAR, which is visually indistinguishable from LANCZOS there and
+    cheaper; larger reductions use LANCZOS.
+    
+    Args:
+        master: Rendered master icon
+        size: Target width and height in pixels
         
-        # Only add dots outside the main G area to avoid clutter
-        distance_from_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-        if distance_from_center > g_radius + 120:
-            dot_size = np.random.randint(4, 12)  # Larger dots for 2048x2048
-            alpha = np.random.randint(40, 100)
-            color = (0, 255, 0, alpha)
-            draw.ellipse([x - dot_size, y - dot_size, x + dot_size, y + dot_size], fill=color)
-    
-    return img
+    Returns:
+        The resized icon (the master itself if it already has that size)
+    """
+    if size == master.width:
+        return master
+    if size * 2 == master.width:
+        return master.reduce(2)
+    if size * 2 >= master.width:
+        return master.resize((size, size), Image.Resampling.BILINEAR)
+    return master.resize((size, size), Image.Resampling.LANCZOS)
 
-def create_icon_files() -> None:
-    """Create icon files in multiple formats and sizes."""
+def save_image(image: Image.Image, filename: str, fmt: str, **params: object) -> None:
+    """
+    Encode an image in memory and write the file in a single call.
     
-    # Create the base icon
-    icon_img = create_goniometer_icon()
+    Pillow's encoders write a file in many small chunks (and the ICO writer
+    seeks back and forth); encoding to a BytesIO first turns that into one
+    buffered write.
     
-    # Save as ultra-high resolution PNG (2048x2048)
-    icon_img.save('icon.png', 'PNG')
-    print(f"Created: icon.png ({icon_img.width}x{icon_img.height})")
+    Args:
+        image: Image to save
+        filename: Output path
+        fmt: Pillow format name ('PNG', 'ICO', ...)
+        **params: Extra encoder options passed to Image.save()
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **params)
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.write(buffer.getbuffer())
+
+def create_icon_files(full_size: bool = False) -> None:
+    """
+    Create icon files in multiple formats and sizes.
     
-    # Create ICO file with multiple sizes including high-res
-    sizes: List[int] = [16, 32, 48, 64, 128, 256, 512]
-    ico_images: List[Image.Image] = []
+    Instead of downsampling one 2048x2048 render, small sizes come from a
+    natively drawn 64x64 master, sizes 64-512 from a 512x512 master, and
+    the 1024 PNG is drawn at its own size. All masters share one texture seed.
     
-    for size in sizes:
-        resized = icon_img.resize((size, size), Image.Resampling.LANCZOS)
-        ico_images.append(resized)
+    Args:
+        full_size: Also render and write the 2048x2048 icon.png
+    """
+    seed = int(np.random.default_rng().integers(2**32))
+    small_master = create_goniometer_icon(64, seed)
+    master = create_goniometer_icon(512, seed)
     
-    # Save as ICO file
-    ico_images[0].save('icon.ico', format='ICO', sizes=[(img.width, img.height) for img in ico_images])
-    print("Created: icon.ico (multiple sizes including 512x512)")
+    # ICO frames and PNG exports share sizes; resample each size only once
+    resized: Dict[int, Image.Image] = {}
     
-    # Create various PNG versions for different uses
-    for size in [32, 64, 128, 256, 512, 1024]:
-        resized = icon_img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(f'icon_{size}.png', 'PNG')
-        print(f"Created: icon_{size}.png")
+    def icon_at(size: int) -> Image.Image:
+        """
+        Get the icon at a given size from the master that suits it.
+        
+        Sizes are taken from a mipmap pyramid: each level is halved from the
+        one above it, so every resample shrinks by at most 2x (BILINEAR).
+        """
+        if size not in resized:
+            source = small_master if size < 64 else master
+            while source.width > 2 * size:
+                source = icon_at(source.width // 2)
+            resized[size] = resize_icon(source, size)
+        return resized[size]
+    
+    # Create ICO file with multiple sizes (the format tops out at 256x256)
+    sizes: List[int] = [16, 32, 48, 64, 128, 256]
+    ico_images = [icon_at(size) for size in sizes]
+    save_image(ico_images[-1], 'icon.ico', 'ICO', sizes=[(size, size) for size in sizes],
+               append_images=ico_images[:-1])
+    print("Created: icon.ico (multiple sizes up to 256x256)")
+    
+    # Create various PNG versions for different uses; the ultra-high
+    # resolution PNG (2048x2048) is only written on request
+    png_files = [(icon_at(size), f'icon_{size}.png') for size in [32, 64, 128, 256, 512]]
+    png_files.append((create_goniometer_icon(1024, seed), 'icon_1024.png'))
+    if full_size:
+        png_files.append((create_goniometer_icon(DESIGN_SIZE, seed), 'icon.png'))
+    
+    def save_png(job: Tuple[Image.Image, str]) -> str:
+        """Write one PNG file and return its name."""
+        image, filename = job
+        save_image(image, filename, 'PNG')
+        return f"{filename} ({image.width}x{image.height})"
+    
+    # PNG compression runs in zlib with the GIL released, so encode concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for created in executor.map(save_png, png_files):
+            print(f"Created: {created}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the YouTube Goniometer icons.")
+    parser.add_argument('--full-size', action='store_true',
+                        help="also write the 2048x2048 icon.png")
+    args = parser.parse_args()
+    
     try:
-        create_icon_files()
+        create_icon_files(full_size=args.full_size)
         print("\n✅ Icon files created successfully!")
         print("\nTo use with PyInstaller:")
         print("pyinstaller --onefile --windowed --icon=icon.ico --name='YouTube-Goniometer' app.py")
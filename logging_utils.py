@@ -6,19 +6,201 @@ utilities for the entire application. It sets up structured logging with
 appropriate levels and formatters for development and production use.
 """
 
+import functools
 import logging
+import logging.handlers
+import os
+import re
 import sys
+import time
 import traceback
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Pattern, Tuple
 
 from config import APP_INFO
 
+# User-friendly messages for known error causes: (needles, message) pairs,
+# checked in order against the lowercased error text
+_ErrorRules = Tuple[Tuple[Tuple[str, ...], str], ...]
+
+_AUDIO_ERROR_RULES: _ErrorRules = (
+    (("sounddevice",),
+     "Audio device error. Please check that your audio device "
+     "is connected and not being used by another application."),
+    (("soundfile",),
+     "Audio file error. The file may be corrupted or in an "
+     "unsupported format."),
+)
+
+_YOUTUBE_ERROR_RULES: _ErrorRules = (
+    (("network", "connection"),
+     "Network error. Please check your internet connection "
+     "and try again."),
+    (("video unavailable", "private"),
+     "This video is not available. It may be private, "
+     "restricted, or deleted."),
+    (("ffmpeg",),
+     "FFmpeg not found. Please install FFmpeg and ensure "
+     "it's accessible from your PATH."),
+    (("format",),
+     "No suitable audio format found for this video. "
+     "Try a different video."),
+)
+
+_GUI_ERROR_RULES: _ErrorRules = (
+    (("qt", "pyside"),
+     "A GUI error occurred. Please restart the application."),
+)
+
+
+# A rule table compiled to one regex (one named group per rule) plus the
+# messages in rule order
+_ErrorMatcher = Tuple[Pattern[str], Tuple[str, ...]]
+
+
+def _compile_error_rules(rules: _ErrorRules) -> _ErrorMatcher:
+    """
+    Compile a rule table into a single case-insensitive regex.
+    
+    Each rule becomes an alternative that looks ahead through the whole
+    text for any of its needles. The alternatives are anchored at the
+    start and tried in order, so the first matching rule wins even if a
+    later rule's needle occurs earlier in the text.
+    
+    Args:
+        rules: Rule table to compile
+        
+    Returns:
+        Compiled pattern and the rule messages, indexed by group name
+    """
+    alternatives = (
+        f"(?P<r{index}>(?=.*(?:{'|'.join(map(re.escape, needles))})))"
+        for index, (needles, _) in enumerate(rules)
+    )
+    pattern = re.compile("|".join(alternatives), re.IGNORECASE | re.DOTALL)
+    return pattern, tuple(message for _, message in rules)
+
+
+_AUDIO_ERROR_MATCHER = _compile_error_rules(_AUDIO_ERROR_RULES)
+_YOUTUBE_ERROR_MATCHER = _compile_error_rules(_YOUTUBE_ERROR_RULES)
+_GUI_ERROR_MATCHER = _compile_error_rules(_GUI_ERROR_RULES)
+
+
+def _match_error_rule(error_text: str, matcher: _ErrorMatcher) -> Optional[str]:
+    """
+    Find the user-friendly message for an error.
+    
+    Args:
+        error_text: Text of the error
+        matcher: Compiled rule table to check
+        
+    Returns:
+        Message of the first matching rule, or None if no rule matches
+    """
+    pattern, messages = matcher
+    match = pattern.match(error_text)
+    if match is None:
+        return None
+    # Every alternative is a named group, so a match always sets lastgroup
+    name = match.lastgroup
+    assert name is not None
+    return messages[int(name[1:])]
+
+
+@functools.lru_cache(maxsize=1)
+def _collect_platform_info() -> Tuple[str, str, Tuple[str, str]]:
+    """
+    Gather platform details for the system information log.
+    
+    platform.platform() can read files or spawn processes on some systems,
+    so the results are collected once per process and shared by every
+    ErrorHandler.
+    
+    Returns:
+        Platform string, Python version and architecture tuple
+    """
+    import platform
+    return platform.platform(), platform.python_version(), platform.architecture()
+
+
+# The application's top-level logger; logging keeps it alive for the life
+# of the process, so it is looked up once instead of on every get_logger()
+_APP_LOGGER = logging.getLogger(APP_INFO["name"])
+
+# Write buffer of the log file, so a batch of records costs few write calls
+_LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes records through a large buffer.
+    
+    The stock handler flushes the file after every record and, to decide on
+    rotation, stats the path and seeks the stream (which also flushes) per
+    record. Here records are only buffered; the file size is tracked in
+    memory and the stream is flushed by flush(), which the batching
+    _BatchingMemoryHandler calls once per batch.
+    """
+    
+    def _open(self) -> Any:
+        """Open the log file with a large write buffer and note its size."""
+        stream = open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        file_status = os.fstat(stream.fileno())
+        self._file_size = file_status.st_size
+        # Never rotate anything but regular files (e.g. not /dev/null)
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check whether writing the record would exceed maxBytes."""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._rotatable:
+            return False
+        # Counted in characters, like the stock handler
+        message_size = len(self.format(record)) + len(self.terminator)
+        return self._file_size + message_size >= self.maxBytes
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, rotating the file first if needed."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            message = self.format(record) + self.terminator
+            self.stream.write(message)
+            self._file_size += len(message)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that flushes its target once after handing over a batch.
+    
+    MemoryHandler.flush() passes the buffered records to the target one by
+    one; with _BufferedRotatingFileHandler as the target they only reach the
+    file buffer, so the target is flushed once the batch is through.
+    """
+    
+    def flush(self) -> None:
+        """Hand all buffered records to the target, then flush it."""
+        with self.lock:
+            super().flush()
+            if self.target:
+                self.target.flush()
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    console_output: bool = True
+    console_output: bool = True,
+    max_log_bytes: int = 4 * 1024 * 1024,
+    log_backup_count: int = 3
 ) -> logging.Logger:
     """
     Configure application-wide logging.
@@ -27,7 +209,9 @@ def setup_logging(
         level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         log_file: Optional path to log file. If None, no file logging.
         console_output: Whether to output logs to console
-        
+        max_log_bytes: Size at which the log file is rotated
+        log_backup_count: Number of rotated log files to keep
+
     Returns:
         Configured logger instance
         
@@ -35,12 +219,19 @@ def setup_logging(
         >>> logger = setup_logging(level="DEBUG", log_file="goniometer.log")
         >>> logger.info("Application started")
     """
-    # Create main logger
-    logger = logging.getLogger(APP_INFO["name"])
+    # Configure main logger
+    logger = _APP_LOGGER
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear any existing handlers
-    logger.handlers.clear()
+    # Close the handlers of any previous setup: buffered records are flushed
+    # to their file (MemoryHandler.close() flushes but leaves its target
+    # open) and file handles are released
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
     
     # Create formatter
     formatter = logging.Formatter(
@@ -60,9 +251,23 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_path)
+        # The file is opened on the first write, rotated so long sessions
+        # stay bounded, and records are buffered so they are written in
+        # batches; ERROR and above flush immediately
+        file_writer = _BufferedRotatingFileHandler(
+            log_path,
+            maxBytes=max_log_bytes,
+            backupCount=log_backup_count,
+            encoding='utf-8',
+            delay=True
+        )
+        file_writer.setFormatter(formatter)
+        file_handler = _BatchingMemoryHandler(
+            capacity=256,
+            flushLevel=logging.ERROR,
+            target=file_writer
+        )
         file_handler.setLevel(logging.DEBUG)  # Always debug level for file
-        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
     return logger
@@ -83,7 +288,7 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         >>> logger.debug("Debug message")
     """
     if name is None:
-        name = APP_INFO["name"]
+        return _APP_LOGGER
     return logging.getLogger(name)
 
 
@@ -103,6 +308,7 @@ class ErrorHandler:
             logger: Optional logger instance. If None, creates default logger.
         """
         self.logger = logger or get_logger("ErrorHandler")
+        self._system_info_logged = False
     
     def handle_audio_error(self, error: Exception, context: str = "") -> str:
         """
@@ -115,21 +321,15 @@ class ErrorHandler:
         Returns:
             User-friendly error message
         """
-        error_msg = f"Audio Error: {str(error)}"
+        error_text = str(error)
         if context:
-            error_msg = f"{context}: {error_msg}"
-            
-        self.logger.error(error_msg, exc_info=True)
+            self.logger.error("%s: Audio Error: %s", context, error_text, exc_info=True)
+        else:
+            self.logger.error("Audio Error: %s", error_text, exc_info=True)
         
         # Return user-friendly message
-        if "sounddevice" in str(error).lower():
-            return ("Audio device error. Please check that your audio device "
-                   "is connected and not being used by another application.")
-        elif "soundfile" in str(error).lower():
-            return ("Audio file error. The file may be corrupted or in an "
-                   "unsupported format.")
-        else:
-            return f"An audio error occurred: {str(error)}"
+        message = _match_error_rule(error_text, _AUDIO_ERROR_MATCHER)
+        return message or f"An audio error occurred: {error_text}"
     
     def handle_youtube_error(self, error: Exception, url: str = "") -> str:
         """
@@ -142,25 +342,14 @@ class ErrorHandler:
         Returns:
             User-friendly error message
         """
-        context = f"YouTube download failed for URL: {url}" if url else "YouTube download failed"
-        self.logger.error(f"{context}: {str(error)}", exc_info=True)
-        
-        error_str = str(error).lower()
-        
-        if "network" in error_str or "connection" in error_str:
-            return ("Network error. Please check your internet connection "
-                   "and try again.")
-        elif "video unavailable" in error_str or "private" in error_str:
-            return ("This video is not available. It may be private, "
-                   "restricted, or deleted.")
-        elif "ffmpeg" in error_str:
-            return ("FFmpeg not found. Please install FFmpeg and ensure "
-                   "it's accessible from your PATH.")
-        elif "format" in error_str:
-            return ("No suitable audio format found for this video. "
-                   "Try a different video.")
+        error_text = str(error)
+        if url:
+            self.logger.error("YouTube download failed for URL: %s: %s", url, error_text, exc_info=True)
         else:
-            return f"YouTube download failed: {str(error)}"
+            self.logger.error("YouTube download failed: %s", error_text, exc_info=True)
+        
+        message = _match_error_rule(error_text, _YOUTUBE_ERROR_MATCHER)
+        return message or f"YouTube download failed: {error_text}"
     
     def handle_gui_error(self, error: Exception, widget: str = "") -> str:
         """
@@ -173,13 +362,14 @@ class ErrorHandler:
         Returns:
             User-friendly error message
         """
-        context = f"GUI error in {widget}" if widget else "GUI error"
-        self.logger.error(f"{context}: {str(error)}", exc_info=True)
-        
-        if "qt" in str(error).lower() or "pyside" in str(error).lower():
-            return ("A GUI error occurred. Please restart the application.")
+        error_text = str(error)
+        if widget:
+            self.logger.error("GUI error in %s: %s", widget, error_text, exc_info=True)
         else:
-            return f"Interface error: {str(error)}"
+            self.logger.error("GUI error: %s", error_text, exc_info=True)
+        
+        message = _match_error_rule(error_text, _GUI_ERROR_MATCHER)
+        return message or f"Interface error: {error_text}"
     
     def handle_unexpected_error(self, error: Exception, context: str = "") -> str:
         """
@@ -192,8 +382,10 @@ class ErrorHandler:
         Returns:
             User-friendly error message
         """
-        full_context = f"Unexpected error in {context}" if context else "Unexpected error"
-        self.logger.critical(f"{full_context}: {str(error)}", exc_info=True)
+        if context:
+            self.logger.critical("Unexpected error in %s: %s", context, error, exc_info=True)
+        else:
+            self.logger.critical("Unexpected error: %s", error, exc_info=True)
         
         # Log full traceback for debugging
         self.logger.debug("Full traceback:", exc_info=True)
@@ -202,36 +394,46 @@ class ErrorHandler:
                f"Please check the log file for details.")
     
     def log_system_info(self) -> None:
-        """Log system information for debugging purposes."""
-        import platform
+        """
+        Log system information for debugging purposes.
+        
+        The information is only gathered and logged once per handler;
+        querying the audio devices is a blocking PortAudio probe that can
+        take hundreds of milliseconds, so repeated calls return immediately.
+        """
+        if self._system_info_logged:
+            return
+        self._system_info_logged = True
+        
         try:
             import sounddevice as sd  # type: ignore
             import soundfile as sf  # type: ignore
             import pyqtgraph as pg  # type: ignore
             from PySide6 import QtCore
             
+            platform_name, python_version, architecture = _collect_platform_info()
             self.logger.info("=== System Information ===")
-            self.logger.info(f"Platform: {platform.platform()}")
-            self.logger.info(f"Python: {platform.python_version()}")
-            self.logger.info(f"Architecture: {platform.architecture()}")
+            self.logger.info("Platform: %s", platform_name)
+            self.logger.info("Python: %s", python_version)
+            self.logger.info("Architecture: %s", architecture)
             
             self.logger.info("=== Audio System ===")
             try:
                 devices = sd.query_devices()
                 default_device = sd.default.device
-                self.logger.info(f"Default audio device: {default_device}")
-                self.logger.info(f"Available devices: {len(devices)}")
+                self.logger.info("Default audio device: %s", default_device)
+                self.logger.info("Available devices: %d", len(devices))
             except Exception as e:
-                self.logger.warning(f"Could not query audio devices: {e}")
+                self.logger.warning("Could not query audio devices: %s", e)
             
             self.logger.info("=== Library Versions ===")
-            self.logger.info(f"SoundDevice: {getattr(sd, '__version__', 'unknown')}")
-            self.logger.info(f"SoundFile: {getattr(sf, '__version__', 'unknown')}")
-            self.logger.info(f"PyQtGraph: {getattr(pg, '__version__', 'unknown')}")
-            self.logger.info(f"PySide6: {getattr(QtCore, '__version__', 'unknown')}")
+            self.logger.info("SoundDevice: %s", getattr(sd, '__version__', 'unknown'))
+            self.logger.info("SoundFile: %s", getattr(sf, '__version__', 'unknown'))
+            self.logger.info("PyQtGraph: %s", getattr(pg, '__version__', 'unknown'))
+            self.logger.info("PySide6: %s", getattr(QtCore, '__version__', 'unknown'))
             
         except Exception as e:
-            self.logger.warning(f"Could not log complete system info: {e}")
+            self.logger.warning("Could not log complete system info: %s", e)
 
 
 def log_exception(logger: logging.Logger, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
@@ -292,25 +494,26 @@ class LoggingContext:
         self.logger = logger
         self.operation = operation
         self.level = level
-        self.start_time: Optional[float] = None
+        self.start_ns: Optional[int] = None
     
     def __enter__(self) -> 'LoggingContext':
         """Enter the context and log start message."""
-        import time
-        self.start_time = time.time()
-        self.logger.log(self.level, f"Starting: {self.operation}")
+        self.start_ns = time.perf_counter_ns()
+        self.logger.log(self.level, "Starting: %s", self.operation)
         return self
     
     def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
         """Exit the context and log completion/error message."""
-        import time
-        duration = time.time() - self.start_time if self.start_time else 0
+        # perf_counter_ns is monotonic and sub-microsecond even on Windows,
+        # where time.time() only ticks every ~16 ms
+        elapsed_ns = time.perf_counter_ns() - self.start_ns if self.start_ns is not None else 0
+        duration_ms = elapsed_ns / 1e6
         
         if exc_type is None:
-            self.logger.log(self.level, f"Completed: {self.operation} ({duration:.2f}s)")
+            self.logger.log(self.level, "Completed: %s (%.2fms)", self.operation, duration_ms)
         else:
             self.logger.error(
-                f"Failed: {self.operation} after {duration:.2f}s - {exc_value}",
+                "Failed: %s after %.2fms - %s", self.operation, duration_ms, exc_value,
                 exc_info=True
             )
         
@@ -6,18 +6,87 @@ YouTube downloader, and goniometer visualization components.
 """
 
 import os
+import threading
 from typing import Optional
 
-import numpy as np
 from PySide6 import QtCore, QtWidgets, QtGui
 
 from config import (
     APP_INFO, UI_CONFIG, SHORTCUTS, TIMER_CONFIG, 
-    get_stylesheet
+    STYLESHEET
 )
 from audio_player import AudioPlayer, AudioPlayerError
 from visualizers import GonioViz
-from youtube_utils import YouTubeDownloadError
+from youtube_utils import YouTubeDownloadCancelled, YouTubeDownloadError
+
+# Title label style, built once from the UI configuration
+_TITLE_LABEL_STYLESHEET = f"""
+    QLabel {{
+        font-size: {UI_CONFIG["font_sizes"]["title"]};
+        font-weight: bold;
+        color: white;
+        padding: 8px;
+        margin: 4px;
+        border: 1px solid rgba(80, 85, 100, 100);
+        border-radius: {UI_CONFIG["border_radius"]};
+        background: rgba(40, 45, 60, 150);
+    }}
+"""
+
+
+class _SourceLoadSignals(QtCore.QObject):
+    """
+    Signals emitted by a _SourceLoader.
+    
+    Signals:
+        finished: Source is ready (str: local file path, str: title)
+        error: Loading failed (str: dialog title, str: message)
+    """
+    
+    finished = QtCore.Signal(str, str)
+    error = QtCore.Signal(str, str)
+
+
+class _SourceLoader(QtCore.QRunnable):
+    """
+    Thread-pool task that resolves an audio source to a local file.
+    
+    YouTube downloads take seconds to minutes; running them here keeps the
+    GUI thread (and the redraw timer) responsive. Results are delivered to
+    the GUI thread through queued signals. A cancelled loader stops its
+    download early and emits nothing.
+    """
+    
+    def __init__(self, player: AudioPlayer, path: str) -> None:
+        """
+        Initialize the loader.
+        
+        Args:
+            player: Player whose resolve_source() fetches the audio
+            path: YouTube URL or local file path to load
+        """
+        super().__init__()
+        self.signals = _SourceLoadSignals()
+        self._player = player
+        self._path = path
+        self._cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Stop the download at its next progress callback; safe from any thread."""
+        self._cancel_event.set()
+    
+    def run(self) -> None:
+        """Download or locate the audio and report the outcome."""
+        try:
+            local_path, title = self._player.resolve_source(self._path, self._cancel_event)
+        except YouTubeDownloadCancelled:
+            return  # Superseded or closing; nobody waits for the result
+        except YouTubeDownloadError as e:
+            self.signals.error.emit("YouTube Download Error", str(e))
+        except Exception as e:
+            self.signals.error.emit("Unexpected Error", f"An unexpected error occurred: {str(e)}")
+        else:
+            self.signals.finished.emit(local_path, title)
 
 
 class GoniometerWindow(QtWidgets.QMainWindow):
@@ -44,7 +113,6 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         
         # Initialize audio player
         self.player = AudioPlayer()
-        self.player.frame_available.connect(self.on_audio_block)
         self.player.state_changed.connect(self.on_state_changed)
         
         # Initialize play action for later reference
@@ -53,11 +121,14 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         # Create UI components
         self._create_ui()
         
+        # Sequence number of the audio chunk last drawn (-1: none yet)
+        self._drawn_sequence = -1
+        
+        # Source load running in the thread pool, if any
+        self._loader: Optional[_SourceLoader] = None
+        
         # Setup timers and updates
         self._setup_timers()
-        
-        # Track last audio data for visualization
-        self._last_block: Optional[np.ndarray] = None
 
     def _setup_window(self) -> None:
         """Configure the main window properties."""
@@ -73,7 +144,7 @@ class GoniometerWindow(QtWidgets.QMainWindow):
             self.setWindowIcon(QtGui.QIcon(icon_path))
         
         # Apply stylesheet from configuration
-        self.setStyleSheet(get_stylesheet())
+        self.setStyleSheet(STYLESHEET)
 
     def _create_ui(self) -> None:
         """Create and layout all UI components."""
@@ -87,20 +158,7 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         # Title label for showing video/track name
         self.title_label = QtWidgets.QLabel("No YouTube video loaded")
         self.title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        title_font_size = str(UI_CONFIG["font_sizes"]["title"])
-        border_radius = str(UI_CONFIG["border_radius"])
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {title_font_size};
-                font-weight: bold;
-                color: white;
-                padding: 8px;
-                margin: 4px;
-                border: 1px solid rgba(80, 85, 100, 100);
-                border-radius: {border_radius};
-                background: rgba(40, 45, 60, 150);
-            }}
-        """)
+        self.title_label.setStyleSheet(_TITLE_LABEL_STYLESHEET)
         layout.addWidget(self.title_label)
 
         # Goniometer visualization (main content area)
@@ -168,11 +226,12 @@ class GoniometerWindow(QtWidgets.QMainWindow):
 
     def _setup_timers(self) -> None:
         """Setup timers for periodic updates."""
-        # Visualization update timer
+        # Visualization update timer; runs only while audio is playing
+        # (see on_state_changed)
         self.redraw_timer = QtCore.QTimer(self)
+        self.redraw_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)  # Coarse timers drift up to 5%
         self.redraw_timer.setInterval(TIMER_CONFIG["redraw_interval"])
         self.redraw_timer.timeout.connect(self._update_visualization)
-        self.redraw_timer.start()
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         """
@@ -228,22 +287,45 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         """
         Load an audio source (YouTube URL or local file).
         
+        The download runs in the global thread pool and this method returns
+        immediately; playback starts in _on_source_loaded() once the audio
+        is available.
+        
         Args:
             path: YouTube URL or local file path to load
         """
+        # Show loading message
+        self.status.showMessage("Loading audio from YouTube...")
+        self.title_label.setText("Loading...")
+        
+        # Close any existing audio
+        self.player.close()
+        self._drawn_sequence = -1
+        
+        # A newer request supersedes any load still in flight; cancel it so
+        # its download does not keep running in the pool
+        if self._loader is not None:
+            self._loader.cancel()
+        self._loader = _SourceLoader(self.player, path)
+        self._loader.signals.finished.connect(self._on_source_loaded)
+        self._loader.signals.error.connect(self._on_source_failed)
+        QtCore.QThreadPool.globalInstance().start(self._loader)
+
+    @QtCore.Slot(str, str)
+    def _on_source_loaded(self, local_path: str, title: str) -> None:
+        """
+        Open and start playing a source once its audio is available.
+        
+        Args:
+            local_path: Local audio file produced by the loader
+            title: Display title (empty for local files)
+        """
+        if self._loader is None or self.sender() is not self._loader.signals:
+            return  # Result of a superseded load
+        self._loader = None
+        
         try:
-            # Show loading message
-            self.status.showMessage("Loading audio from YouTube...")
-            self.title_label.setText("Loading...")
-            
-            # Allow GUI to update
-            QtWidgets.QApplication.processEvents()
-            
-            # Close any existing audio
-            self.player.close()
-            
-            # Load new audio source
-            loaded_path, title = self.player.open(path)
+            loaded_path, _ = self.player.open(local_path)
             
             # Update goniometer with new sample rate
             self.gonio.samplerate = int(self.player.samplerate)
@@ -261,13 +343,25 @@ class GoniometerWindow(QtWidgets.QMainWindow):
                 f"Playing: {display_title} — {self.player.samplerate} Hz, {channels_text}"
             )
             
-        except YouTubeDownloadError as e:
-            self._show_error("YouTube Download Error", str(e))
         except AudioPlayerError as e:
             self._show_error("Audio Error", str(e))
         except Exception as e:
             self._show_error("Unexpected Error", f"An unexpected error occurred: {str(e)}")
 
+    @QtCore.Slot(str, str)
+    def _on_source_failed(self, title: str, message: str) -> None:
+        """
+        Report a failed source load.
+        
+        Args:
+            title: Error dialog title
+            message: Error message text
+        """
+        if self._loader is None or self.sender() is not self._loader.signals:
+            return  # Failure of a superseded load
+        self._loader = None
+        self._show_error(title, message)
+
     def toggle_playback(self) -> None:
         """
         Toggle between play and pause states.
@@ -319,17 +413,7 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         
         QtWidgets.QMessageBox.about(self, f"About {APP_INFO['name']}", about_text)
 
-    @QtCore.Slot(np.ndarray)
-    def on_audio_block(self, data: np.ndarray) -> None:
-        """
-        Handle incoming audio data from the player.
-        
-        Args:
-            data: Audio data array from the player
-        """
-        self._last_block = data
-        # Update goniometer immediately for responsiveness
-        self.gonio.update_audio(data)
+
 
     @QtCore.Slot(bool)
     def on_state_changed(self, playing: bool) -> None:
@@ -342,6 +426,14 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         state_text = "Playing" if playing else "Paused"
         self.status.showMessage(state_text, TIMER_CONFIG["status_message_timeout"])
         
+        # Nothing new is played while paused or stopped, so stop polling
+        # for frames; catch up on the last played chunk before stopping
+        if playing:
+            self.redraw_timer.start()
+        else:
+            self.redraw_timer.stop()
+            self._update_visualization()
+        
         # Update play button text/icon based on state
         if self.play_action is not None:
             if playing:
@@ -355,11 +447,20 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         """
         Periodic update for visualization components.
         
-        This method is called by a timer to ensure smooth visualization
-        updates even when no new audio data is available.
+        This method is called by a timer and is the only thing that drives
+        the goniometer. It pulls the most recently played audio chunk from
+        the player and skips the redraw when no new chunk has been played
+        since the last tick (paused, stopped or buffering), leaving the
+        display as it was.
         """
-        if self._last_block is not None:
-            self.gonio.update_audio(self._last_block)
+        sequence = self.player.frame_sequence
+        if sequence == self._drawn_sequence:
+            return
+        
+        data = self.player.latest_frame()
+        if data is not None:
+            self._drawn_sequence = sequence
+            self.gonio.update_audio(data)
 
     def _show_error(self, title: str, message: str) -> None:
         """
@@ -381,7 +482,11 @@ class GoniometerWindow(QtWidgets.QMainWindow):
         Args:
             event: The close event
         """
-        # Clean up audio resources
+        # Clean up audio resources. The global thread pool is waited on at
+        # exit, so a download in flight is cancelled rather than finished
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
         self.player.close()
         
         # Stop timers
@@ -11,6 +11,9 @@ from typing import Any
 
 import numpy as np
 import pyqtgraph as pg  # type: ignore
+from PySide6 import QtWidgets
+
+from config import GONIOMETER_CONFIG
 
 
 class BaseViz(pg.GraphicsLayoutWidget):  # type: ignore
@@ -52,12 +55,16 @@ class BaseViz(pg.GraphicsLayoutWidget):  # type: ignore
         """
         super().__init__(parent)
         
+        # GraphicsLayoutWidget binds its layout's clear() onto each instance,
+        # which would shadow the clear() methods of BaseViz and subclasses
+        del self.clear
+        
         # Store audio parameters
         self.samplerate = samplerate
         
         # Configure appearance for professional audio analysis
         self.setBackground('k')  # Black background (standard for audio tools)
-        self.setAntialiasing(True)  # Smooth rendering
+        self.setAntialiasing(GONIOMETER_CONFIG["antialias"])
         
         # Set up professional styling
         self._configure_appearance()
@@ -72,7 +79,7 @@ class BaseViz(pg.GraphicsLayoutWidget):  # type: ignore
         # Configure default plot styling
         pg.setConfigOption('background', 'k')  # Black background
         pg.setConfigOption('foreground', 'w')  # White foreground
-        pg.setConfigOption('antialias', True)  # Antialiasing
+        pg.setConfigOption('antialias', GONIOMETER_CONFIG["antialias"])
         
     @abstractmethod
     def update_audio(self, block: np.ndarray) -> None:
@@ -104,6 +111,27 @@ class BaseViz(pg.GraphicsLayoutWidget):  # type: ignore
         """
         raise NotImplementedError("Subclasses must implement update_audio method")
     
+    def cache_static_items(self, *items: Any) -> None:
+        """
+        Cache the rendering of items that do not change from frame to frame.
+        
+        Each item and its children (pyqtgraph items often draw through a
+        child item) is rendered once into an off-screen pixmap in device
+        coordinates, which later repaints simply blit. Qt redraws the pixmap
+        only when the item is updated or the view is resized or rescaled.
+        Items whose data changes every frame should not be cached, as their
+        pixmap would be rebuilt on every update.
+        
+        Args:
+            *items: Graphics items to cache
+        """
+        cache_mode = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+        pending = list(items)
+        while pending:
+            item = pending.pop()
+            item.setCacheMode(cache_mode)
+            pending.extend(item.childItems())
+    
     def set_samplerate(self, samplerate: int) -> None:
         """
         Update the sample rate for the visualizer.
@@ -123,8 +151,9 @@ class BaseViz(pg.GraphicsLayoutWidget):  # type: ignore
         This method clears all visual elements and resets the display.
         Useful when switching audio sources or stopping playback.
         """
-        # Clear all plots in the layout
-        self.clear()
+        # Clear all plots in the layout; calling self.clear() here would
+        # recurse into this method
+        self.ci.clear()
         
     def reset(self) -> None:
         """
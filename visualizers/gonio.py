@@ -37,13 +37,79 @@ Phase Correlation Values:
 """
 
 from typing import Any, List
+import bisect
+import math
+
 import numpy as np
 import pyqtgraph as pg  # type: ignore
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui
 
 from .base import BaseViz
 from config import COLORS, GONIOMETER_CONFIG, PHASE_THRESHOLDS
 
+# Blocks whose peak stays below this level are treated as silence
+_SILENCE_PEAK = 1e-6
+
+# Qt pen styles for the line style names used in GONIOMETER_CONFIG
+_PEN_STYLES = {
+    "solid": QtCore.Qt.PenStyle.SolidLine,
+    "dash": QtCore.Qt.PenStyle.DashLine,
+    "dot": QtCore.Qt.PenStyle.DotLine,
+    "dashdot": QtCore.Qt.PenStyle.DashDotLine,
+    "dashdotdot": QtCore.Qt.PenStyle.DashDotDotLine,
+}
+
+
+class _GonioScatter(pg.ScatterPlotItem):  # type: ignore
+    """
+    Scatter item specialized for peak-normalized goniometer points.
+    
+    Every point lies within [-1, 1] on both axes, so the data bounds (and
+    with them boundingRect() and shape()) are fixed rather than rescanned
+    from the points after each update. Consecutive frames usually have the
+    same number of points; their positions are then written into the
+    existing point records, which keeps each point's resolved symbol
+    instead of looking it up in pyqtgraph's symbol atlas point by point.
+    """
+    
+    _UNIT_BOUNDS = (-1.0, 1.0)
+    
+    def dataBounds(self, ax: int, frac: float = 1.0, orthoRange: Any = None) -> Any:
+        """
+        Report the fixed unit range as the data bounds on both axes.
+        
+        Overridden rather than assigned to self.bounds, which pyqtgraph
+        resets on every view change (viewTransformChanged) and would then
+        cache the extent of a single frame.
+        
+        Args:
+            ax: Axis index (0 for x, 1 for y)
+            frac: Fraction of the data to cover (ignored)
+            orthoRange: Range limit on the other axis (ignored)
+            
+        Returns:
+            (min, max) bounds, or (None, None) while there are no points
+        """
+        if self.data is None or len(self.data) == 0:
+            return (None, None)
+        return self._UNIT_BOUNDS
+    
+    def set_positions(self, positions: np.ndarray) -> None:
+        """
+        Show a new set of normalized points.
+        
+        Args:
+            positions: Points with shape (samples, 2), all within [-1, 1]
+        """
+        if len(positions) == len(self.data):
+            # Same point count: move the points, styles stay resolved
+            self.data['x'] = positions[:, 0]
+            self.data['y'] = positions[:, 1]
+            self.invalidate()
+            return
+        
+        self.setData(pos=positions)
+
 
 class GonioViz(BaseViz):
     """
@@ -91,10 +157,21 @@ class GonioViz(BaseViz):
         # Audio processing parameters from configuration
         self.max_points = int(GONIOMETER_CONFIG["max_points"])
         self.normalization_alpha = 0.8  # For peak normalization smoothing
-        
-        # Trail effect data storage
-        self.trail_data: List[np.ndarray] = []
-        self.trail_max_frames = int(GONIOMETER_CONFIG["trail_max_frames"])
+        self._peak = 0.0  # Smoothed peak level used to normalize the display
+        
+        # The trail curves form a ring of recent frames: each new frame
+        # replaces the oldest curve instead of shifting data through all
+        self.trail_max_frames = min(int(GONIOMETER_CONFIG["trail_max_frames"]),
+                                    len(self.trail_curves))
+        self._trail_newest = -1  # Index of the curve holding the newest frame
+        
+        # Preallocated point storage, one slot per trail curve: each frame
+        # is gathered into the slot of the curve it will replace, and the
+        # curves plot views of their slots. Frames never exceed max_points.
+        self._trail_buffer = np.empty(
+            (self.trail_max_frames, self.max_points, 2), dtype=np.float32
+        )
+        self._bin_index = np.arange(self.max_points // 2)  # See _gather_peaks()
         
     def _setup_plot_appearance(self) -> None:
         """Configure the plot appearance to professional standards."""
@@ -117,6 +194,14 @@ class GonioViz(BaseViz):
         self.plot.setLabel('left', 'Right Channel (R)')
         self.plot.setLabel('bottom', 'Left Channel (L)')
         
+        # Axes (which also draw the grid) and the title are static for a
+        # fixed range; replaying their drawing every frame dominated repaints
+        self.cache_static_items(
+            self.plot.getAxis('left'),
+            self.plot.getAxis('bottom'),
+            self.plot.titleLabel
+        )
+        
         # Professional dark background
         self.setBackground(COLORS["plot_bg"])
         
@@ -134,45 +219,50 @@ class GonioViz(BaseViz):
         
         # Center cross lines (L=0, R=0) - show channel balance
         center_line_width = int(GONIOMETER_CONFIG["line_widths"]["center"])
-        center_line_style = str(GONIOMETER_CONFIG["center_line_style"]).title() + "Line"
         center_pen = pg.mkPen(
             center_color, 
             width=center_line_width,
-            style=getattr(QtCore.Qt.PenStyle, center_line_style)
+            style=_PEN_STYLES[GONIOMETER_CONFIG["center_line_style"]]
         )
         
         plot_range = GONIOMETER_CONFIG["plot_range"]
-        self.plot.plot([0, 0], plot_range, pen=center_pen)  # Vertical (R=0)
-        self.plot.plot(plot_range, [0, 0], pen=center_pen)  # Horizontal (L=0)
+        reference_lines = [
+            self.plot.plot([0, 0], plot_range, pen=center_pen),  # Vertical (R=0)
+            self.plot.plot(plot_range, [0, 0], pen=center_pen),  # Horizontal (L=0)
+        ]
         
         # Diagonal reference lines for mono detection
         diag_line_width = int(GONIOMETER_CONFIG["line_widths"]["diagonal"])
-        diag_line_style = str(GONIOMETER_CONFIG["diagonal_line_style"]).title() + "Line"
         diag_pen = pg.mkPen(
             diag_color,
             width=diag_line_width, 
-            style=getattr(QtCore.Qt.PenStyle, diag_line_style)
+            style=_PEN_STYLES[GONIOMETER_CONFIG["diagonal_line_style"]]
         )
         
         # L=R diagonal (mono in both channels)
-        self.plot.plot([-1, 1], [-1, 1], pen=diag_pen)
+        reference_lines.append(self.plot.plot([-1, 1], [-1, 1], pen=diag_pen))
         
         # L=-R diagonal (anti-phase mono - mono incompatible!)  
-        self.plot.plot([-1, 1], [1, -1], pen=diag_pen)
+        reference_lines.append(self.plot.plot([-1, 1], [1, -1], pen=diag_pen))
+        
+        # The lines never change; draw them from a cached pixmap
+        self.cache_static_items(*reference_lines)
         
     def _setup_visualization_elements(self) -> None:
         """Setup the main visualization elements (scatter plot and trails)."""
         # Main scatter plot for current audio samples
         scatter_color = COLORS["scatter_main"]
-        self.scatter = pg.ScatterPlotItem(
+        self.scatter = _GonioScatter(
             size=GONIOMETER_CONFIG["scatter_size"],
             brush=pg.mkBrush(scatter_color),
             pen=None  # No outline for performance
         )
         self.plot.addItem(self.scatter)
         
-        # Trail effect curves for visual persistence
-        self.trail_curves = []
+        # Trail effect curves for visual persistence; pens are ordered from
+        # the most recent frame to the oldest
+        self.trail_curves: List[pg.PlotCurveItem] = []
+        self.trail_pens = []
         trail_colors = COLORS["trail_colors"]
         
         trail_line_width = int(GONIOMETER_CONFIG["line_widths"]["trail"])
@@ -181,8 +271,10 @@ class GonioViz(BaseViz):
                 color, 
                 width=trail_line_width
             )
-            curve = self.plot.plot(pen=trail_pen)
+            curve = pg.PlotCurveItem(pen=trail_pen)
+            self.plot.addItem(curve)
             self.trail_curves.append(curve)
+            self.trail_pens.append(trail_pen)
             
     def _setup_phase_correlation_display(self) -> None:
         """Setup the phase correlation coefficient display."""
@@ -191,6 +283,25 @@ class GonioViz(BaseViz):
             color=COLORS["text_primary"],
             anchor=(0, 1)  # Top-left anchor
         )
+        self.phase_text.setZValue(1)  # Keep above the trail curves
+        
+        # Fonts and colors of the readings are built once; updates only swap
+        # the plain text, color and font instead of re-parsing rich text
+        self._phase_font = QtGui.QFont()
+        self._phase_font.setPointSize(12)
+        self._phase_value_font = QtGui.QFont(self._phase_font)
+        self._phase_value_font.setBold(True)
+        
+        # Correlation levels in ascending order with the color for each
+        # bucket: below moderate, moderate up to good, good and above
+        self._phase_thresholds = (PHASE_THRESHOLDS["moderate"], PHASE_THRESHOLDS["good"])
+        self._phase_colors = tuple(
+            pg.mkColor(COLORS[f"phase_{level}"])
+            for level in ("poor", "moderate", "good")
+        )
+        self._phase_undefined_color = pg.mkColor(128, 128, 128)
+        self._phase_idle_color = pg.mkColor(200, 200, 200)
+        self._phase_shown = ('Phase: --', None, None)  # (text, color, font)
         self.plot.addItem(self.phase_text)
         
         # Position in top-left corner of plot
@@ -212,98 +323,178 @@ class GonioViz(BaseViz):
                   range [-1.0, 1.0] for proper visualization.
                   
         Processing Steps:
-            1. Extract left and right channels
-            2. Downsample if necessary for performance
-            3. Normalize for consistent display range
-            4. Calculate phase correlation coefficient
-            5. Update scatter plot and trail effects
+            1. Gather left/right points, downsampling long blocks
+            2. Normalize for consistent display range
+            3. Calculate phase correlation coefficient
+            4. Update scatter plot and trail effects
         """
-        # Extract stereo channels
-        left, right = self._extract_channels(block)
-        
-        # Downsample for performance if needed
-        left, right = self._downsample_if_needed(left, right)
+        # Gather the points once (L=X, R=Y) as float32; scatter and trail
+        # share them
+        positions = self._gather_positions(block)
         
-        # Normalize for display (prevents clipping visualization)
-        left, right = self._normalize_channels(left, right)
+        # Normalize in place (prevents clipping visualization)
+        block_peak = self._normalize_positions(positions)
         
-        # Calculate and display phase correlation
-        self._update_phase_correlation(left, right)
+        # Calculate and display phase correlation; silence has none. The
+        # moments use every sample of the block: downsampled display points
+        # over-represent each bin's loudest sample and would bias the reading
+        if block_peak >= _SILENCE_PEAK:
+            self._update_phase_correlation(*self._block_channels(block))
+        elif len(positions) > 1:
+            self._show_phase('Phase: ---', self._phase_undefined_color, self._phase_font)
         
         # Update main visualization
-        self._update_scatter_plot(left, right)
+        self._update_scatter_plot(positions)
         
         # Update trail effect
-        self._update_trail_effect(left, right)
+        self._update_trail_effect(positions)
         
-    def _extract_channels(self, block: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    def _gather_positions(self, block: np.ndarray) -> np.ndarray:
         """
-        Extract left and right channels from audio block.
+        Extract and interleave the channels into the next trail buffer slot.
+        
+        Blocks within the display point limit are copied as they are;
+        longer blocks are reduced to the limit by _gather_peaks().
         
         Args:
-            block: Audio data array
+            block: Audio data with shape (samples,) or (samples, channels)
             
         Returns:
-            Tuple of (left_channel, right_channel) arrays
+            Float32 array with shape (points, 2), L in column 0 and R in
+            column 1; a view of the trail buffer slot of the next frame
         """
-        if block.ndim == 1:
-            # Mono input - create pseudo-stereo for visualization
-            left = block
-            right = block * 0.8  # Slight attenuation to show stereo effect
-        else:
-            # Stereo input
-            left = block[:, 0]
-            right = block[:, 1] if block.shape[1] > 1 else block[:, 0]
+        slot = self._trail_buffer[(self._trail_newest + 1) % self.trail_max_frames]
+        if len(block) > self.max_points:
+            return self._gather_peaks(block, slot)
             
-        return left, right
+        positions = slot[:len(block)]
+        self._write_points(block, positions)
+        return positions
         
-    def _downsample_if_needed(self, left: np.ndarray, right: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    def _gather_peaks(self, block: np.ndarray, slot: np.ndarray) -> np.ndarray:
         """
-        Downsample audio data if it exceeds display point limit.
+        Downsample a long block without losing its transients.
+        
+        Plain stride decimation skips the samples in between, so short
+        peaks (the widest excursions on the display) can vanish. Instead
+        the block is cut into max_points // 2 equal bins, and each bin
+        contributes its first sample, which keeps the regular sampling of
+        the signal, and its loudest sample (largest |L| + |R|), in time
+        order. This is M4 downsampling reduced to what matters for an XY
+        display: there is no time axis whose min/max would be drawn.
+        
+        The display intentionally over-weights peaks: half of the drawn
+        points are bin maxima, so the scatter and its trails sit further
+        out than a uniform sample of the L/R distribution would, in
+        exchange for transients that stay visible. Measurements must not
+        use these points; the phase correlation reads the full block.
         
         Args:
-            left: Left channel data
-            right: Right channel data
+            block: Audio data longer than max_points
+            slot: Trail buffer slot to write the points into
             
         Returns:
-            Downsampled (left, right) tuple
+            View of slot holding the selected points
         """
-        if len(left) > self.max_points:
-            # Use integer decimation for even sampling
-            step = len(left) // self.max_points
-            left = left[::step]
-            right = right[::step]
-            
-        return left, right
+        bins = len(self._bin_index)
+        step = len(block) // bins
+        
+        # The remainder of fewer than step samples at the end is dropped
+        frames = block[:bins * step]
+        if frames.ndim == 2 and frames.shape[1] == 2 and frames.dtype == np.float32:
+            # The player's stereo float32 blocks are binned as they are
+            points = frames
+        else:
+            points = np.empty((bins * step, 2), dtype=np.float32)
+            self._write_points(frames, points)
+        
+        # Loudest sample of each bin, as an index into points; summing the
+        # two columns beats sum(axis=1) and take() beats fancy indexing
+        magnitude = np.abs(points)
+        magnitude = (magnitude[:, 0] + magnitude[:, 1]).reshape(bins, step)
+        peaks = magnitude.argmax(axis=1)
+        peaks += self._bin_index * step
+        
+        positions = slot[:2 * bins]
+        positions[0::2] = points[::step]
+        positions[1::2] = points.take(peaks, axis=0)
+        return positions
+        
+    @staticmethod
+    def _block_channels(block: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the full-resolution left and right channels of a block.
+        
+        A mono block serves as both channels: the 0.8 attenuation applied
+        for display does not change the correlation.
         
-    def _normalize_channels(self, left: np.ndarray, right: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        Args:
+            block: Audio data with shape (samples,) or (samples, channels)
+            
+        Returns:
+            Tuple of floating-point (left, right) arrays, views of the block
+            unless it has to be converted from integer samples
         """
-        Normalize channels for consistent goniometer display.
+        if block.dtype.kind != 'f':
+            block = block.astype(np.float32)
+        if block.ndim == 1:
+            return block, block
+        return block[:, 0], block[:, 1] if block.shape[1] > 1 else block[:, 0]
         
-        Uses peak normalization to ensure full use of display range
-        while maintaining relative channel relationships.
+    @staticmethod
+    def _write_points(block: np.ndarray, out: np.ndarray) -> None:
+        """
+        Write the left/right channels of a block into a point array.
         
         Args:
-            left: Left channel data
-            right: Right channel data
+            block: Audio data with shape (samples,) or (samples, channels)
+            out: Float32 array with shape (samples, 2) to fill
+        """
+        if block.ndim == 2 and block.shape[1] > 1:
+            # Stereo input: a plain copy
+            out[:] = block[:, :2]
+            return
             
+        # Mono input - create pseudo-stereo for visualization
+        out[:, 0] = block if block.ndim == 1 else block[:, 0]
+        if block.ndim == 1:
+            # Slight attenuation to show stereo effect
+            np.multiply(out[:, 0], 0.8, out=out[:, 1])
+        else:
+            out[:, 1] = out[:, 0]
+        
+    def _normalize_positions(self, positions: np.ndarray) -> float:
+        """
+        Normalize goniometer points in place for consistent display.
+        
+        Uses peak normalization across both channels to ensure full use of
+        the display range while maintaining relative channel relationships.
+        The peak follows a new louder block at once but decays by
+        normalization_alpha per frame, so the display does not jump in
+        scale between consecutive blocks.
+        
+        Args:
+            positions: Points with shape (samples, 2), L in column 0 and R
+                       in column 1; scaled in place
+                       
         Returns:
-            Normalized (left, right) tuple
+            Peak level of the block before normalization
         """
-        if len(left) == 0:
-            return left, right
+        if len(positions) == 0:
+            return 0.0
             
-        # Find peak levels for normalization
-        left_peak = np.max(np.abs(left))
-        right_peak = np.max(np.abs(right))
-        overall_peak = max(left_peak, right_peak)
+        # Peak level over both channels, without an abs() temporary
+        block_peak = float(max(positions.max(), -positions.min()))
+        self._peak = max(block_peak, self.normalization_alpha * self._peak)
+        if self._peak < _SILENCE_PEAK:
+            # Let the peak settle at zero during silence instead of decaying
+            # towards subnormals, whose reciprocal overflows to inf
+            self._peak = 0.0
         
         # Normalize if we have signal
-        if overall_peak > 0:
-            left = left / overall_peak
-            right = right / overall_peak
-            
-        return left, right
+        if self._peak > 0:
+            positions *= 1.0 / self._peak
+        return block_peak
         
     def _update_phase_correlation(self, left: np.ndarray, right: np.ndarray) -> None:
         """
@@ -319,57 +510,75 @@ class GonioViz(BaseViz):
             left: Left channel data
             right: Right channel data
         """
-        if len(left) > 1 and len(right) > 1:
-            try:
-                # Calculate Pearson correlation coefficient
-                correlation_matrix = np.corrcoef(left, right)
-                correlation = correlation_matrix[0, 1]
+        n = len(left)
+        if n > 1 and len(right) > 1:
+            # Pearson correlation from the raw moments; the dot products
+            # stream both channels without np.corrcoef's 2xN stack and 2x2
+            # covariance matrix
+            sx = float(left.sum())
+            sy = float(right.sum())
+            sxx = float(np.dot(left, left))
+            syy = float(np.dot(right, right))
+            sxy = float(np.dot(left, right))
+            var_x = n * sxx - sx * sx
+            var_y = n * syy - sy * sy
+            
+            # The moments are usually float32 sums, so a constant channel
+            # leaves a rounding residue rather than an exact zero variance
+            if var_x > 1e-6 * n * sxx and var_y > 1e-6 * n * syy:
+                # Clamp rounding overshoot
+                correlation = (n * sxy - sx * sy) / math.sqrt(var_x * var_y)
+                correlation = min(1.0, max(-1.0, correlation))
+                
+                # Color-code based on correlation value (a value equal to a
+                # threshold belongs to the bucket above it)
+                bucket = bisect.bisect_right(self._phase_thresholds, correlation)
+                color = self._phase_colors[bucket]
                 
-                if not np.isnan(correlation):
-                    # Format correlation value
-                    phase_text = f'Phase: {correlation:+.3f}'
-                    
-                    # Color-code based on correlation value
-                    if correlation >= PHASE_THRESHOLDS["good"]:
-                        color = COLORS["phase_good"]
-                    elif correlation >= PHASE_THRESHOLDS["moderate"]:
-                        color = COLORS["phase_moderate"] 
-                    else:
-                        color = COLORS["phase_poor"]
-                    
-                    # Update display with colored text
-                    self.phase_text.setHtml(
-                        f'<div style="color: rgb{color}; font-size: 12pt; '
-                        f'font-weight: bold;">{phase_text}</div>'
-                    )
-                else:
-                    self.phase_text.setHtml(
-                        '<div style="color: rgb(128,128,128); font-size: 12pt;">Phase: ---</div>'
-                    )
-                    
-            except (ValueError, np.linalg.LinAlgError):
-                # Handle edge cases (e.g., constant signals)
-                self.phase_text.setHtml(
-                    '<div style="color: rgb(128,128,128); font-size: 12pt;">Phase: ERR</div>'
-                )
+                # Update display with colored text
+                self._show_phase(f'Phase: {correlation:+.3f}', color,
+                                 self._phase_value_font)
+            else:
+                # Constant channel: correlation is undefined
+                self._show_phase('Phase: ---', self._phase_undefined_color,
+                                 self._phase_font)
                 
-    def _update_scatter_plot(self, left: np.ndarray, right: np.ndarray) -> None:
+    def _show_phase(self, text: str, color: QtGui.QColor, font: QtGui.QFont) -> None:
+        """
+        Update the phase display, touching only what changed.
+        
+        The displayed value (three decimals) and its color often repeat
+        between frames; text, color and font are each only set again when
+        they differ from what is shown.
+        
+        Args:
+            text: Plain text of the reading
+            color: One of the prebuilt phase colors
+            font: One of the prebuilt phase fonts
+        """
+        shown_text, shown_color, shown_font = self._phase_shown
+        if font is not shown_font:
+            self.phase_text.setFont(font)
+        if color is not shown_color:
+            self.phase_text.setColor(color)
+        if text != shown_text:
+            self.phase_text.setText(text)
+        self._phase_shown = (text, color, font)
+            
+    def _update_scatter_plot(self, positions: np.ndarray) -> None:
         """
         Update the main scatter plot with current audio samples.
         
         Args:
-            left: Left channel data
-            right: Right channel data
+            positions: Normalized points with shape (samples, 2) (L=X, R=Y)
         """
-        if len(left) > 0 and len(right) > 0:
-            # Create position array for scatter plot (L=X, R=Y)
-            positions = np.column_stack((left, right))
-            self.scatter.setData(pos=positions)
+        if len(positions) > 0:
+            self.scatter.set_positions(positions)
         else:
             # Clear if no data
             self.scatter.clear()
             
-    def _update_trail_effect(self, left: np.ndarray, right: np.ndarray) -> None:
+    def _update_trail_effect(self, positions: np.ndarray) -> None:
         """
         Update the visual trail effect showing recent audio history.
         
@@ -378,47 +587,46 @@ class GonioViz(BaseViz):
         periodic or evolving stereo content.
         
         Args:
-            left: Left channel data  
-            right: Right channel data
+            positions: Normalized points with shape (samples, 2) (L=X, R=Y)
         """
-        if len(left) > 0 and len(right) > 0:
-            # Store current positions for trail effect
-            positions = np.column_stack((left, right))
-            self.trail_data.append(positions)
-            
-            # Limit trail history
-            if len(self.trail_data) > self.trail_max_frames:
-                self.trail_data.pop(0)
+        if len(positions) > 0:
+            # Only the curve holding the oldest frame receives new data; the
+            # points already sit in its buffer slot and are plotted as views
+            newest = (self._trail_newest + 1) % self.trail_max_frames
+            self._trail_newest = newest
+            curve = self.trail_curves[newest]
+            if len(positions) > 1:
+                curve.setData(positions[:, 0], positions[:, 1])
+            else:
+                curve.clear()
                 
-            # Draw trail curves (most recent to oldest)
-            for i, curve in enumerate(self.trail_curves):
-                if i < len(self.trail_data):
-                    # Get data from trail history (most recent first)
-                    trail_positions = self.trail_data[-(i+1)]
-                    
-                    if len(trail_positions) > 1:
-                        # Draw trail curve
-                        curve.setData(trail_positions[:, 0], trail_positions[:, 1])
-                    else:
-                        curve.clear()
-                else:
-                    curve.clear()
+            # The other curves keep their data and just age by one step:
+            # restyle them from most recent to oldest, with older frames
+            # drawn on top
+            for age in range(self.trail_max_frames):
+                curve = self.trail_curves[(newest - age) % self.trail_max_frames]
+                curve.setPen(self.trail_pens[age])
+                curve.setZValue(age / self.trail_max_frames)
         else:
             # Clear all trails if no data
             for curve in self.trail_curves:
                 curve.clear()
+            self._trail_newest = -1
                 
     def clear(self) -> None:
-        """Clear all visualization elements."""
-        super().clear()
+        """
+        Clear all visualization elements.
+        
+        Only the plotted data is cleared; unlike BaseViz.clear(), the plot
+        itself stays in the layout so the goniometer can keep drawing.
+        """
         self.scatter.clear()
         for curve in self.trail_curves:
             curve.clear()
-        self.trail_data.clear()
+        self._trail_newest = -1
         
     def reset(self) -> None:
         """Reset the goniometer to initial state."""
         self.clear()
-        self.phase_text.setHtml(
-            '<div style="color: rgb(200,200,200); font-size: 12pt;">Phase: ---</div>'
-        )
\ No newline at end of file
+        self._peak = 0.0
+        self._show_phase('Phase: ---', self._phase_idle_color, self._phase_font)
\ No newline at end of file
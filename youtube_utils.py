@@ -6,18 +6,42 @@ for audio analysis in the goniometer application.
 """
 
 import os
+import re
+import shutil
 import tempfile
+import threading
+from functools import lru_cache
 from typing import Tuple, Optional
 
 import yt_dlp  # type: ignore
 
 from config import YOUTUBE_CONFIG, FFMPEG_CONFIG, ERROR_MESSAGES
 
+# youtube.com (any subdomain, e.g. www., m., music.) or youtu.be as the host,
+# with or without a scheme
+_YOUTUBE_HOST_RE = re.compile(r'(?:^|://|\.)(?:youtube\.com|youtu\.be)(?:[/?#:]|$)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _is_executable_file(path: str) -> bool:
+    """
+    Check that a file exists and is executable.
+    
+    FFmpeg is validated before every download but does not come and go
+    while the application runs, so results are cached per path; call
+    _is_executable_file.cache_clear() to check again.
+    """
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
 
 class YouTubeDownloadError(Exception):
     """Exception raised when YouTube download fails."""
 
 
+class YouTubeDownloadCancelled(YouTubeDownloadError):
+    """Exception raised when a download is cancelled before it completes."""
+
+
 class YouTubeDownloader:
     """
     Handles downloading audio from YouTube URLs.
@@ -36,17 +60,24 @@ class YouTubeDownloader:
         """
         self.ffmpeg_path = ffmpeg_path or FFMPEG_CONFIG["default_path"]
         
-    def download_to_wav(self, url: str) -> Tuple[str, str]:
+    def download_to_wav(self, url: str,
+                        cancel_event: Optional[threading.Event] = None) -> Tuple[str, str]:
         """
         Download the best audio stream from YouTube and convert to WAV.
         
+        Setting cancel_event stops the download at yt-dlp's next progress
+        or post-processing callback, which arrive many times per second
+        while data is transferred; the partial download is deleted.
+        
         Args:
             url: YouTube URL to download from
+            cancel_event: Optional event that cancels the download when set
             
         Returns:
             Tuple of (wav_file_path, video_title)
             
         Raises:
+            YouTubeDownloadCancelled: If cancel_event is set before the download completes
             YouTubeDownloadError: If download or conversion fails
             FileNotFoundError: If the output WAV file is not created
             
@@ -68,6 +99,7 @@ class YouTubeDownloader:
             'outtmpl': os.path.join(tmpdir, '%(title)s.%(ext)s'),
             'noplaylist': True,
             'quiet': True,
+            'concurrent_fragment_downloads': int(YOUTUBE_CONFIG["concurrent_fragments"]),
             'ffmpeg_location': self.ffmpeg_path,
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
@@ -80,10 +112,20 @@ class YouTubeDownloader:
             ],
         }
         
+        if cancel_event is not None:
+            def check_cancelled(status: dict) -> None:
+                if cancel_event.is_set():
+                    raise yt_dlp.utils.DownloadCancelled()
+            
+            ydl_opts['progress_hooks'] = [check_cancelled]
+            ydl_opts['postprocessor_hooks'] = [check_cancelled]
+        
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 # Extract video info and download
                 info = ydl.extract_info(url, download=True)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise yt_dlp.utils.DownloadCancelled()
                 title = info.get('title', 'YouTube Video')
                 
                 # Find the generated WAV file
@@ -96,9 +138,14 @@ class YouTubeDownloader:
                 # Move to expected location
                 os.replace(produced, wav_path)
                 
-        except yt_dlp.DownloadError as e:
-            raise YouTubeDownloadError(f"yt-dlp download failed: {str(e)}") from e
         except Exception as e:
+            # yt-dlp may wrap a hook's cancellation in another error, so
+            # the event decides rather than the exception type
+            if cancel_event is not None and cancel_event.is_set():
+                shutil.rmtree(tmpdir, ignore_errors=True)
+                raise YouTubeDownloadCancelled("Download cancelled") from e
+            if isinstance(e, yt_dlp.DownloadError):
+                raise YouTubeDownloadError(f"yt-dlp download failed: {str(e)}") from e
             raise YouTubeDownloadError(f"Unexpected error during download: {str(e)}") from e
             
         return wav_path, title
@@ -113,16 +160,7 @@ class YouTubeDownloader:
         Returns:
             True if URL looks like a YouTube URL, False otherwise
         """
-        youtube_domains = [
-            'youtube.com',
-            'www.youtube.com', 
-            'youtu.be',
-            'm.youtube.com',
-            'music.youtube.com'
-        ]
-        
-        url_lower = url.lower()
-        return any(domain in url_lower for domain in youtube_domains)
+        return _YOUTUBE_HOST_RE.search(url) is not None
     
     @staticmethod
     def validate_ffmpeg(ffmpeg_path: Optional[str] = None) -> bool:
@@ -140,10 +178,11 @@ class YouTubeDownloader:
             ffmpeg_path = str(FFMPEG_CONFIG["default_path"])
             
         ffmpeg_exe = os.path.join(ffmpeg_path, "ffmpeg.exe" if os.name == 'nt' else "ffmpeg")
-        return os.path.isfile(ffmpeg_exe) and os.access(ffmpeg_exe, os.X_OK)
+        return _is_executable_file(ffmpeg_exe)
 
 
-def download_youtube_to_wav(url: str) -> Tuple[str, str]:
+def download_youtube_to_wav(url: str,
+                            cancel_event: Optional[threading.Event] = None) -> Tuple[str, str]:
     """
     Convenience function to download YouTube audio to WAV format.
     
@@ -152,11 +191,13 @@ def download_youtube_to_wav(url: str) -> Tuple[str, str]:
     
     Args:
         url: YouTube URL to download
+        cancel_event: Optional event that cancels the download when set
         
     Returns:
         Tuple of (wav_file_path, video_title)
         
     Raises:
+        YouTubeDownloadCancelled: If cancel_event is set before the download completes
         YouTubeDownloadError: If download fails
         FileNotFoundError: If FFmpeg is not found or output file is missing
     """
@@ -166,4 +207,4 @@ def download_youtube_to_wav(url: str) -> Tuple[str, str]:
     if not YouTubeDownloader.validate_ffmpeg():
         raise FileNotFoundError(ERROR_MESSAGES["no_ffmpeg"])
     
-    return downloader.download_to_wav(url)
\ No newline at end of file
+    return downloader.download_to_wav(url, cancel_event)
\ No newline at end of file